@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+
+from fftanalysis.analysis_service import *  # noqa: F401,F403 - keeps "from analysis_service import ..." working
+from fftanalysis.analysis_service import main
+
+# Analysis service: python analysis_service.py serve, and analysis_service.py query <recording> to ask it.
+# The code is in fftanalysis.analysis_service; this wrapper only keeps the script name.
+
+if __name__ == "__main__":
+    main()
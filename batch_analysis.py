@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+
+from fftanalysis.batch_analysis import *  # noqa: F401,F403 - keeps "from batch_analysis import ..." working
+from fftanalysis.batch_analysis import main
+
+# Batch peak analysis: python batch_analysis.py <directory or glob> [-o peaks.csv].
+# The code is in fftanalysis.batch_analysis; this wrapper only keeps the script name.
+
+if __name__ == "__main__":
+    main()
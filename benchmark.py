@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+import shutil
+import tracemalloc
+import contextlib
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # Benchmarks never open windows
+from fftanalysis.analyzer import FFTAnalyzer, CHANNELS
+from fftanalysis.signal_generator import SignalGenerator
+from fftanalysis.lvm_reader import read_lvm
+
+# Benchmarks for the analysis path: load_data (with read_lvm against the
+# pandas read_csv path it replaced), perform_fft, detect_peaks, plot_asd and
+# the ASD_backup.py script, on synthetic recordings of 10^3 to 10^max_exp
+# samples, plus the start-up cost of short command line runs (imports and the
+# fftanalysis CLI, each in a fresh interpreter). Each stage is timed over
+# several repeats and run once more under tracemalloc for its peak allocation
+# (stages that run a child process report that child's own peak resident set
+# instead). Results go to a JSON file and can be compared against a stored
+# baseline; slower stages are reported as regressions.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SAMPLING_RATE = 1000  # Samples per second in the synthetic recordings
+TONES = [(50, 1.0), (120, 0.5), (200, 0.7)]  # (frequency, amplitude) of the injected lines
+WRITE_CHUNK = 1_000_000  # Rows formatted per write when generating .lvm files
+MIN_REGRESSION_S = 0.005  # Slowdowns smaller than this are timer noise, whatever the ratio
+
+# Runs "python <args>" in the child and writes the child's peak resident set (kB) to a file at exit.
+# rusage of a spawned child (wait4, RUSAGE_CHILDREN) also counts the parent's pages at spawn time, so
+# this benchmark's own ~100 MiB would show up in every child; VmHWM covers the child's memory only.
+CHILD_PEAK_RSS = """
+import sys, atexit, runpy
+report = sys.argv.pop(1)
+
+def write_peak():
+    with open("/proc/self/status") as f:
+        peak = [line.split()[1] for line in f if line.startswith("VmHWM:")]
+    with open(report, "w") as f:
+        f.write(peak[0] if peak else "0")
+
+atexit.register(write_peak)
+args = sys.argv[1:]
+if args[0] == "-c":
+    sys.argv = ["-c"] + args[2:]
+    exec(compile(args[1], "<string>", "exec"), {"__name__": "__main__"})
+elif args[0] == "-m":
+    sys.argv = [args[1]] + args[2:]
+    runpy.run_module(args[1], run_name="__main__", alter_sys=True)
+else:
+    sys.argv = args
+    runpy.run_path(args[0], run_name="__main__")
+"""
+
+
+def synthetic_generator(seed=0):  # Four noisy polarization channels sharing the injected lines
+    tones = [(amplitude, frequency, 0.0) for frequency, amplitude in TONES]
+    return SignalGenerator(SAMPLING_RATE, tones=tones, noise_amplitude=0.1, n_channels=len(CHANNELS),
+                           channel_phases=np.arange(len(CHANNELS)), seed=seed)
+
+
+def synthetic_signals(n, seed=0):  # Time column plus four channels
+    t, signals = synthetic_generator(seed).generate(n)
+    return [t] + list(signals)
+
+
+def write_synthetic_lvm(path, n, seed=0):  # Tab-separated text in the layout load_data expects
+    synthetic_generator(seed).write_lvm(path, n, chunk_size=WRITE_CHUNK)
+
+
+def measure(func, repeats, in_subprocess=False):  # Best and median wall time plus peak memory
+    times = []
+    child_peaks = []
+    with contextlib.redirect_stdout(io.StringIO()):  # Keep the analyzer's status prints out of the report
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = func()
+            times.append(time.perf_counter() - start)
+            child_peaks.append(result)
+        if in_subprocess:  # func returns the peak resident set of the child it ran
+            peak = max(child_peaks)
+        else:  # Peak traced allocation of one extra run
+            tracemalloc.start()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return {"best_s": min(times), "median_s": float(np.median(times)), "peak_bytes": peak}
+
+
+def in_memory_analyzer(n):  # Analyzer whose data are generated, not parsed
+    analyzer = FFTAnalyzer(f"synthetic_{n}.lvm")
+    names = ["Time(s)"] + CHANNELS
+    analyzer.data = dict(zip(names, synthetic_signals(n)))
+    return analyzer
+
+
+def run_python(args, workdir, stdin=None):  # One fresh interpreter; returns its own peak resident set in bytes
+    # The parse cache is shared (warm loads are the common case), but every run gets an empty result
+    # store, so repeats time the analysis rather than a store hit and never touch the user's store
+    store = tempfile.mkdtemp(prefix="results-", dir=workdir)
+    report = os.path.join(store, "peak_rss")
+    env = dict(os.environ, MPLBACKEND="Agg", PYTHONPATH=HERE, LVM_CACHE_DIR=os.path.join(workdir, "cache"),
+               FFT_RESULT_STORE=store)
+    try:
+        subprocess.run([sys.executable, "-c", CHILD_PEAK_RSS, report] + args, input=stdin, text=True,
+                       cwd=workdir, env=env, check=True, stdout=subprocess.DEVNULL)
+        with open(report) as f:
+            return int(f.read()) * 1024
+    finally:
+        shutil.rmtree(store, ignore_errors=True)
+
+
+def run_asd_backup(path, workdir):  # The interactive script, fed its two prompts on stdin
+    return run_python([os.path.join(HERE, "ASD_backup.py")], workdir, stdin=f"{path}\n0.1\n")
+
+
+def benchmark_startup(workdir, repeats):  # Wall time of imports and small CLI commands
+    path = os.path.join(workdir, "startup.lvm")
+    write_synthetic_lvm(path, 10**4)
+    run_python(["-m", "fftanalysis", "analyze", path], workdir)  # Build the cache before timing warm runs
+    commands = {
+        "import_fftanalysis": ["-c", "import fftanalysis"],
+        "import_analyzer": ["-c", "from fftanalysis import FFTAnalyzer"],
+        "import_signal_generator": ["-c", "from fftanalysis import SignalGenerator"],
+        "cli_help": ["-m", "fftanalysis", "--help"],
+        "cli_generate": ["-m", "fftanalysis", "generate", os.path.join(workdir, "generated.lvm"), "-n", "1000"],
+        "cli_analyze": ["-m", "fftanalysis", "analyze", path],
+        "cli_peaks": ["-m", "fftanalysis", "peaks", path, "-o", os.path.join(workdir, "peaks.csv")],
+        "cli_plot": ["-m", "fftanalysis", "plot", path, "-o", os.path.join(workdir, "plot.png")],
+    }
+    results = {}
+    for name, args in commands.items():
+        results[name] = measure(lambda: run_python(args, workdir), repeats, in_subprocess=True)
+        print(f"  {name:<24} {results[name]['median_s']:10.4f} s")
+    return results
+
+
+def benchmark_size(n, workdir, repeats, file_stages, script_stage):  # Every stage at one signal length
+    results = {}
+    analyzer = in_memory_analyzer(n)
+    analyzer.perform_fft("polarized_x_a")
+    with contextlib.redirect_stdout(io.StringIO()):
+        peaks = analyzer.detect_peaks(min_amplitude=1.0, prominence=0.5, interactive=False)
+
+    plot_path = os.path.join(workdir, "plot.png")  # Saving is what renders the figure
+    stages = {
+        "perform_fft": lambda: analyzer.perform_fft("polarized_x_a"),
+        "perform_fft_multi": lambda: analyzer.perform_fft_multi(),
+        "detect_peaks": lambda: analyzer.detect_peaks(min_amplitude=1.0, prominence=0.5, interactive=False),
+        "plot_asd": lambda: analyzer.plot_asd(save_path=plot_path, peaks=peaks, show=False),
+        "plot_asd_decimated": lambda: analyzer.plot_asd(save_path=plot_path, peaks=peaks, decimate=2000, show=False),
+    }
+    if n >= 4096:
+        stages["perform_fft_welch"] = lambda: analyzer.perform_fft("polarized_x_a", mode="welch")
+
+    if file_stages:
+        path = os.path.join(workdir, f"synthetic_{n}.lvm")
+        write_synthetic_lvm(path, n)
+        cache_dir = os.path.join(workdir, "cache")
+        file_analyzer = FFTAnalyzer(path)
+        names = ["Time(s)"] + CHANNELS
+        stages["read_csv"] = lambda: pd.read_csv(path, sep="\t", comment=";", header=None, names=names)
+        stages["read_lvm"] = lambda: read_lvm(path, names=names)
+        stages["read_lvm_one_channel"] = lambda: read_lvm(path, names=names, usecols=CHANNELS[:1])
+        stages["load_data"] = lambda: file_analyzer.load_data()
+        file_analyzer.load_data(use_cache=True, cache_dir=cache_dir)  # Build the cache before timing warm loads
+        stages["load_data_cached"] = lambda: file_analyzer.load_data(use_cache=True, cache_dir=cache_dir)
+        if script_stage:
+            stages["asd_backup_script"] = lambda: run_asd_backup(path, workdir)
+
+    for name, func in stages.items():
+        results[name] = measure(func, repeats, in_subprocess=name == "asd_backup_script")
+        print(f"  {name:<22} {results[name]['median_s']:10.4f} s  {results[name]['peak_bytes'] / 2**20:10.1f} MiB")
+    return results
+
+
+def compare(results, baseline, tolerance, min_seconds=MIN_REGRESSION_S):  # List of (size, stage, baseline, current) regressions
+    regressions = []
+    sections = dict(results["sizes"], startup=results.get("startup", {}))
+    previous_sections = dict(baseline.get("sizes", {}), startup=baseline.get("startup", {}))
+    for size, stages in sections.items():
+        for stage, current in stages.items():
+            previous = previous_sections.get(size, {}).get(stage)
+            if not previous:
+                continue
+            # A slowdown must exceed the ratio and min_seconds: sub-millisecond stages vary by more than any ratio
+            limit = max(previous["median_s"] * (1 + tolerance), previous["median_s"] + min_seconds)
+            if current["median_s"] > limit:
+                regressions.append((size, stage, previous["median_s"], current["median_s"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the FFT analysis pipeline.")
+    parser.add_argument("--min-exp", type=int, default=3, help="Smallest size is 10**min_exp samples")
+    parser.add_argument("--max-exp", type=int, default=6, help="Largest size is 10**max_exp samples")
+    parser.add_argument("--file-max-exp", type=int, default=6, help="Largest size written to .lvm files")
+    parser.add_argument("--script-max-exp", type=int, default=5, help="Largest size run through ASD_backup.py")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--no-startup", action="store_true", help="Skip the start-up timings")
+    parser.add_argument("-o", "--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown")
+    parser.add_argument("--min-seconds", type=float, default=MIN_REGRESSION_S, help="Allowed absolute slowdown")
+    args = parser.parse_args()
+
+    results = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sizes": {},
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        if not args.no_startup:
+            print("Start-up")
+            results["startup"] = benchmark_startup(workdir, args.repeats)
+        for exp in range(args.min_exp, args.max_exp + 1):
+            n = 10**exp
+            print(f"N = {n}")
+            results["sizes"][str(n)] = benchmark_size(
+                n, workdir, args.repeats, exp <= args.file_max_exp, exp <= args.script_max_exp
+            )
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance, args.min_seconds)
+        for size, stage, previous, current in regressions:
+            print(f"REGRESSION N={size} {stage}: {previous:.4f} s -> {current:.4f} s")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
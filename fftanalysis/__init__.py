@@ -0,0 +1,51 @@
+import importlib
+
+# FFT analysis of Michelson interferometer recordings.
+#
+# The analysis code lives in the submodules of this package (fftanalysis.analyzer,
+# fftanalysis.lvm_reader, ...); the scripts at the top of the repository are thin
+# wrappers around them. The package re-exports the public names of the submodules.
+# Names are resolved on first access (module __getattr__, PEP 562), so
+# "import fftanalysis" loads nothing else, and each name only pulls in what its
+# own module needs: fftanalysis.SignalGenerator costs numpy, while pandas,
+# scipy.signal and matplotlib are imported by the functions that use them.
+# The command line interface is in fftanalysis.cli (python -m fftanalysis).
+
+__version__ = "0.1.0"
+
+_MODULES = {
+    "analyzer": ["FFTAnalyzer", "CHANNELS", "COLUMNS", "compare_precision"],
+    "signal_generator": ["SignalGenerator"],
+    "lvm_reader": ["LVMData", "read_lvm", "read_lvm_header", "sample_interval"],
+    "lvm_cache": ["load_lvm_cached", "clear_cache"],
+    "result_store": ["ResultStore"],
+    "fft_cache": ["get_fft_setup", "fft_cache_stats"],
+    "spectral": ["welch_psd", "batched_asd", "zoom_asd"],
+    "ooc_fft": ["out_of_core_asd"],
+    "nufft": ["sampling_irregularity", "nufft_asd"],
+    "noise": ["noise_floor", "snr_peaks"],
+    "peak_refine": ["refine_peaks"],
+    "peak_sweep": ["PeakCandidates"],
+    "peak_tracker": ["PeakTracker", "track_spectrogram"],
+    "cross_spectral": ["cross_spectral_matrix", "coherent_peaks"],
+    "spectrogram": ["compute_spectrogram", "plot_spectrogram"],
+    "fast_plot": ["decimate_spectrum"],
+    "instrumentation": ["Instrumentation"],
+    "streaming": ["StreamingAnalyzer"],
+}
+_EXPORTS = {name: module for module, names in _MODULES.items() for name in names}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):  # Import the defining module on first access
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,268 @@
+import os
+import json
+import time
+import socket
+import asyncio
+import argparse
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from fftanalysis.analyzer import FFTAnalyzer, CHANNELS
+from fftanalysis.fast_plot import decimate_spectrum
+from fftanalysis.fft_cache import fft_cache_stats
+from fftanalysis.result_store import ResultStore
+
+# Long-running analysis daemon.
+#
+# One process keeps the imports, FFT plans, loaded recordings (memmaps of the
+# binary cache) and computed spectra warm, and answers requests over a local
+# Unix socket or a TCP port on localhost. The protocol is JSON lines: each
+# request is one JSON object with an "op" ("analyze", "stats", "ping" or
+# "shutdown") and an optional "id" that is echoed back; each response is one
+# JSON object with "ok" and either "result" or "error".
+#
+# The asyncio loop only does I/O; analyses run in a thread pool (numpy and
+# scipy release the GIL in the heavy parts). Requests on the same recording are
+# serialised because FFTAnalyzer is stateful; different recordings run in
+# parallel. Recordings and spectra are kept in LRU caches and dropped when the
+# file's size or mtime changes, so a repeated query costs a peak search on a
+# cached spectrum. AnalysisClient is a small blocking client for scripts.
+
+MAX_LINE = 2**20  # Longest request line accepted
+
+
+def default_socket_path():  # Socket location, overridable with FFT_SERVICE_SOCKET
+    return os.environ.get(
+        "FFT_SERVICE_SOCKET", os.path.join(tempfile.gettempdir(), f"fft_analysis_{os.getuid()}.sock")
+    )
+
+
+class AnalysisService:
+    def __init__(self, workers=None, max_recordings=8, max_spectra=64, result_store=None, use_cache=True):
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analysis")
+        self.max_recordings = max_recordings
+        self.max_spectra = max_spectra
+        self.result_store = result_store  # Optional ResultStore so spectra also survive restarts
+        self.use_cache = use_cache
+        self.requests = 0
+        self.started = time.time()
+        self._recordings = OrderedDict()  # path -> (file version, FFTAnalyzer)
+        self._spectra = OrderedDict()  # (path, version, channel, mode parameters) -> FFTAnalyzer.current_spectrum() handle
+        self._file_locks = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def _file_lock(self, path):
+        with self._lock:
+            return self._file_locks.setdefault(path, threading.Lock())
+
+    def _analyzer(self, path):  # Warm analyzer of an unchanged file, loading it on first use
+        stat = os.stat(path)
+        version = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            entry = self._recordings.get(path)
+            if entry and entry[0] == version:
+                self._recordings.move_to_end(path)
+                return version, entry[1]
+
+        analyzer = FFTAnalyzer(path, result_store=self.result_store)
+        analyzer.load_data(use_cache=self.use_cache)
+        with self._lock:
+            self._recordings[path] = (version, analyzer)
+            self._recordings.move_to_end(path)
+            while len(self._recordings) > self.max_recordings:
+                self._recordings.popitem(last=False)
+        return version, analyzer
+
+    def _spectrum(self, path, version, analyzer, channel, mode, nperseg, overlap):  # Make the channel's spectrum current
+        key = (path, version, channel, mode, nperseg if mode == "welch" else None,
+               overlap if mode == "welch" else None)
+        with self._lock:
+            spectrum = self._spectra.get(key)
+            if spectrum is not None:
+                self._spectra.move_to_end(key)
+        if spectrum is not None:  # Noise floors computed for it earlier come back with it
+            analyzer.restore_spectrum(spectrum)
+            return
+
+        analyzer.perform_fft(channel, mode=mode, nperseg=nperseg, overlap=overlap)
+        with self._lock:
+            self._spectra[key] = analyzer.current_spectrum()
+            while len(self._spectra) > self.max_spectra:
+                self._spectra.popitem(last=False)
+
+    def analyze(self, request):  # Spectra and peaks of the requested channels of one file
+        start = time.perf_counter()
+        path = os.path.abspath(request["file"])
+        channels = request.get("channels") or CHANNELS
+        mode = request.get("mode", "fft")
+        nperseg = request.get("nperseg", 4096)
+        overlap = request.get("overlap", 0.5)
+        min_snr = request.get("min_snr")
+        spectrum_bins = request.get("spectrum_bins")  # Log-binned spectrum in the reply; None leaves it out
+
+        results = []
+        with self._file_lock(path):
+            version, analyzer = self._analyzer(path)
+            for channel in channels:
+                self._spectrum(path, version, analyzer, channel, mode, nperseg, overlap)
+                analyzer.detect_peaks(
+                    min_amplitude=request.get("min_amplitude", 0.05), prominence=request.get("prominence", 0.01),
+                    width=request.get("width"), interactive=False, min_snr=min_snr,
+                    floor_fraction=request.get("floor_fraction", 0.1),
+                    floor_percentile=request.get("floor_percentile", 50), verbose=False,
+                )
+                freq, asd, peaks = analyzer.positive_freq, analyzer.positive_asd, analyzer.peak_indices
+                result = {
+                    "channel": channel,
+                    "frequencies": freq[peaks].tolist(),
+                    "amplitudes": asd[peaks].tolist(),
+                    # null without a prominence threshold; JSON has no NaN
+                    "prominences": [None if np.isnan(p) else p for p in analyzer.peak_prominences.tolist()],
+                }
+                if spectrum_bins:
+                    plot_freq, plot_asd = decimate_spectrum(freq, asd, n_bins=spectrum_bins, keep=peaks)
+                    result["spectrum"] = {"freq": plot_freq.tolist(), "asd": plot_asd.tolist()}
+                results.append(result)
+        return {"file": path, "mode": mode, "channels": results,
+                "elapsed_ms": 1000 * (time.perf_counter() - start)}
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "uptime_s": time.time() - self.started,
+                "recordings": list(self._recordings),
+                "spectra": len(self._spectra),
+                "fft_plans": fft_cache_stats(),
+            }
+
+    async def _dispatch(self, request):
+        op = request.get("op")
+        if op == "ping":
+            return "pong"
+        if op == "stats":
+            return self.stats()
+        if op == "shutdown":
+            self._server.close()
+            return "shutting down"
+        if op == "analyze":
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.pool, self.analyze, request)  # Load errors go back to the client
+        raise ValueError(f"Unknown op: {op!r}")
+
+    async def _handle(self, reader, writer):  # One connection: requests are answered in order
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.requests += 1
+                request = {}
+                try:
+                    request = json.loads(line)
+                    response = {"ok": True, "result": await self._dispatch(request)}
+                except Exception as e:
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                if "id" in request:
+                    response["id"] = request["id"]
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass  # Client went away or sent an over-long line
+        finally:
+            writer.close()
+
+    async def serve(self, socket_path=None, host="127.0.0.1", port=None):  # Runs until a shutdown request
+        if port is None:
+            socket_path = socket_path or default_socket_path()
+            if os.path.exists(socket_path):  # Stale socket of an earlier run
+                os.remove(socket_path)
+            self._server = await asyncio.start_unix_server(self._handle, path=socket_path, limit=MAX_LINE)
+            print(f"Analysis service listening on {socket_path}")
+        else:
+            self._server = await asyncio.start_server(self._handle, host=host, port=port, limit=MAX_LINE)
+            print(f"Analysis service listening on {host}:{port}")
+        try:
+            async with self._server:
+                await self._server.wait_closed()
+        finally:
+            self.pool.shutdown(wait=False)
+            if port is None and os.path.exists(socket_path):
+                os.remove(socket_path)
+
+
+class AnalysisClient:
+    def __init__(self, socket_path=None, host="127.0.0.1", port=None, timeout=None):
+        if port is None:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(socket_path or default_socket_path())
+        else:
+            self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.stream = self.sock.makefile("rwb")
+        self._next_id = 0
+
+    def request(self, op, **params):  # Send one request and wait for its response
+        self._next_id += 1
+        self.stream.write(json.dumps(dict(params, op=op, id=self._next_id)).encode() + b"\n")
+        self.stream.flush()
+        line = self.stream.readline()
+        if not line:
+            raise ConnectionError("Analysis service closed the connection.")
+        response = json.loads(line)
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    def analyze(self, file_path, **params):  # Peaks (and optionally a log-binned spectrum) per channel
+        return self.request("analyze", file=file_path, **params)
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local FFT analysis service.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="Run the service")
+    serve.add_argument("--socket", default=None, help="Unix socket path (default: FFT_SERVICE_SOCKET or /tmp)")
+    serve.add_argument("--port", type=int, default=None, help="Listen on this localhost TCP port instead")
+    serve.add_argument("-j", "--workers", type=int, default=None, help="Compute threads")
+    serve.add_argument("--max-recordings", type=int, default=8, help="Recordings kept loaded")
+    serve.add_argument("--result-store", action="store_true", help="Also persist spectra in the result store")
+    query = commands.add_parser("query", help="Send one analyze request and print the JSON reply")
+    query.add_argument("file")
+    query.add_argument("--socket", default=None)
+    query.add_argument("--port", type=int, default=None)
+    query.add_argument("--channels", nargs="+", default=None, choices=CHANNELS)
+    query.add_argument("--mode", choices=["fft", "welch", "nufft", "auto"], default="fft")
+    query.add_argument("--min-amplitude", type=float, default=0.05)
+    query.add_argument("--prominence", type=float, default=0.01)
+    query.add_argument("--min-snr", type=float, default=None)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        service = AnalysisService(workers=args.workers, max_recordings=args.max_recordings,
+                                  result_store=ResultStore() if args.result_store else None)
+        asyncio.run(service.serve(socket_path=args.socket, port=args.port))
+    else:
+        with AnalysisClient(socket_path=args.socket, port=args.port) as client:
+            result = client.analyze(args.file, channels=args.channels, mode=args.mode,
+                                    min_amplitude=args.min_amplitude, prominence=args.prominence,
+                                    min_snr=args.min_snr)
+        print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+import os
+import numpy as np
+from fftanalysis.lvm_cache import load_lvm_cached
+from fftanalysis.lvm_reader import read_lvm, select_columns
+from fftanalysis.fft_cache import get_fft_setup
+from fftanalysis.spectral import welch_psd, batched_asd, zoom_asd
+from fftanalysis.peak_sweep import PeakCandidates
+from fftanalysis.spectrogram import compute_spectrogram, plot_spectrogram
+from fftanalysis.fast_plot import decimate_spectrum
+from fftanalysis.peak_refine import refine_peaks
+from fftanalysis.instrumentation import NULL_STAGE
+from fftanalysis.ooc_fft import out_of_core_asd
+from fftanalysis.nufft import sampling_irregularity, nufft_asd
+from fftanalysis.noise import noise_floor
+from fftanalysis.cross_spectral import cross_spectral_matrix, coherent_peaks
+from fftanalysis.result_store import ResultStore
+
+CHANNELS = ["polarized_x_a", "polarized_y_a", "polarized_x_b", "polarized_y_b"]
+COLUMNS = ["Time(s)"] + CHANNELS
+
+
+class FFTAnalyzer:
+    def __init__(self, file_path, instrumentation=None, dtype=np.float64, result_store=None):
+        self.file_path = file_path
+        self.instrumentation = instrumentation  # instrumentation.Instrumentation, or None to disable
+        self.result_store = result_store  # result_store.ResultStore to reuse spectra and peaks across runs
+        self.dtype = np.dtype(dtype)  # float32 halves working memory; time is always float64
+        self.file_name = os.path.basename(file_path)
+        self.data = None
+        self.freq = None
+        self.asd = None
+        self.positive_freq = None
+        self.positive_asd = None
+        self.positive_spectrum = None
+        self.spectrum_length = None  # Transform length N behind positive_spectrum
+        self.channels = None
+        self.channel_asd = None
+        self.peak_indices = None
+        self.peak_prominences = None  # NaN when detect_peaks ran without a prominence threshold
+        self._peak_candidates = None
+        self.noise_floor = None
+        self._noise_floor_asd = None  # Spectrum the floors below belong to
+        self._noise_floors = {}  # (fraction, percentile) -> floor
+        self.spectrograms = {}
+        self.csd_channels = None
+        self.csd_freq = None
+        self.csd = None
+        self.coherence = None
+        self._result_key = None  # (content hash, channel, parameters) of the current spectrum
+        self._sampling = None  # nufft.sampling_irregularity of the loaded time column
+
+    def _stage(self, name, **info):  # Timing context for one stage; a shared no-op when disabled
+        if self.instrumentation is None:
+            return NULL_STAGE
+        return self.instrumentation.stage(name, file=self.file_name, **info)
+
+    def _sample_interval(self):  # Delta_X from the LVM header, else the step over the whole time span
+        return self.check_sampling()["dt"]  # A single printed step can be off by its last digit
+
+    def check_sampling(self):  # Nominal step, jitter and gaps of Time(s), computed once per load
+        if self._sampling is None:
+            self._sampling = sampling_irregularity(
+                self.data["Time(s)"], dt=getattr(self.data, "sample_interval", None)
+            )
+        return self._sampling
+
+    def _spectrum_key(self, signal_column, params):  # Result-store key of a spectrum, None without a store
+        if self.result_store is None:
+            return None
+        return self.result_store.spectrum_key(self.file_path, signal_column, self._sample_interval(), **params)
+
+    def load_data(self, use_cache=False, cache_dir=None, channels=None):  # Load the data; OSError or ValueError if unreadable
+        with self._stage("load_data", cached=use_cache) as stage:
+            if use_cache:  # Columns become zero-copy memmaps of the binary cache
+                self.data = load_lvm_cached(self.file_path, COLUMNS, cache_dir=cache_dir, dtype=self.dtype)
+                if channels is not None:  # The cache holds every column; keep the requested ones as read_lvm does
+                    self.data = select_columns(self.data, ["Time(s)"] + list(channels))
+            else:  # Only the requested channels are kept; time is always loaded
+                self.data = read_lvm(self.file_path, names=COLUMNS, usecols=channels, dtype=self.dtype)
+            stage.record(samples=len(self.data["Time(s)"]), columns=len(self.data))
+        self._sampling = None
+        print("Data successfully loaded.")
+
+    def perform_fft(self, signal_column, mode="fft", nperseg=4096, overlap=0.5, window="hann",
+                    keep_spectrum=False):  # Perform FFT on the specified signal column
+        with self._stage("perform_fft", column=signal_column, mode=mode) as stage:
+            if mode in ("fft", "auto") and self.check_sampling()["irregular"]:
+                if mode == "fft":
+                    print("Warning: Time(s) is not evenly sampled; use mode='nufft' or 'auto' for a correct ASD.")
+                else:
+                    mode = "nufft"
+            elif mode == "auto":
+                mode = "fft"
+            params = {"mode": mode, "dtype": self.dtype.name}
+            if mode == "welch":
+                params.update(nperseg=nperseg, overlap=overlap, window=window)
+            self._result_key = None if keep_spectrum else self._spectrum_key(signal_column, params)
+            stored = self._result_key and self.result_store.get_spectrum(*self._result_key)
+            if stored:  # Same file, channel and parameters as an earlier run
+                self.freq, self.asd = self.positive_freq, self.positive_asd = stored
+                self.positive_spectrum = None
+                stage.record(stored=True, bins=len(self.asd))
+                return
+
+            signal = np.asarray(self.data[signal_column])  # Extract signal data
+            dt = self._sample_interval()  # Time step
+
+            if mode == "welch":  # Averaged PSD, streamed one segment at a time
+                freq, psd = welch_psd(signal, dt, nperseg=nperseg, overlap=overlap, window=window)
+                np.sqrt(psd, out=psd)  # ASD in place, no second full-length array
+                self.freq = self.positive_freq = freq
+                self.asd = self.positive_asd = psd
+                self.positive_spectrum = None  # Averaged power has no complex spectrum to refine
+                self._store_spectrum()
+                stage.record(samples=len(signal), bins=len(psd), output_bytes=psd.nbytes)
+                return
+            if mode == "nufft":  # Dropped samples or jittered time stamps: transform at the actual times
+                freq, asd = nufft_asd(self.data["Time(s)"], signal, dt=self.check_sampling()["dt"])
+                self.freq = self.positive_freq = freq
+                self.asd = self.positive_asd = asd
+                self.positive_spectrum = None
+                self._store_spectrum()
+                stage.record(samples=len(signal), bins=len(asd), output_bytes=asd.nbytes)
+                return
+            if mode != "fft":
+                raise ValueError(f"Unknown FFT mode: {mode!r}")
+
+            N = len(signal)  # Number of samples
+
+            setup = get_fft_setup(N, dt, dtype=signal.dtype)  # Cached frequency grid and output buffer
+            self.freq = setup.freq  # Frequency array
+            fft_signal = np.fft.fft(signal, out=setup.spectrum_buffer())  # Perform FFT into the cached buffer (small N)
+            self.asd = np.abs(fft_signal)  # Amplitude Spectral Density, sqrt(|X|^2 / N)
+            self.asd *= 1 / np.sqrt(N)
+
+            # Keep only positive frequencies
+            self.positive_freq = self.freq[:N//2]
+            self.positive_asd = self.asd[:N//2]
+            # The output buffer may be reused by the next FFT of this shape, so copy if asked to keep it
+            self.positive_spectrum = fft_signal[:N//2].copy() if keep_spectrum else None
+            self.spectrum_length = N
+            self._store_spectrum()
+            stage.record(samples=N, bins=N // 2, output_bytes=self.asd.nbytes)
+
+    def _store_spectrum(self):  # Save the positive spectrum under the current key
+        if self._result_key:
+            self.result_store.put_spectrum(*self._result_key, self.positive_freq, self.positive_asd)
+
+    def perform_fft_out_of_core(self, signal_column, memory_budget=256 * 2**20, scratch_dir=None):  # Full-resolution ASD on disk
+        with self._stage("perform_fft_out_of_core", column=signal_column) as stage:
+            dt = self._sample_interval()
+            signal = np.asarray(self.data[signal_column])  # Still disk-backed when loaded with use_cache=True
+            self.freq, self.asd = out_of_core_asd(
+                signal, dt, scratch_dir=scratch_dir, memory_budget=memory_budget
+            )
+            self.positive_freq, self.positive_asd = self.freq, self.asd  # detect_peaks reads the memmaps directly
+            self.positive_spectrum = None
+            self._result_key = None
+            stage.record(samples=len(signal), bins=len(self.asd), memory_budget=memory_budget)
+
+    def perform_fft_multi(self, channels=None, workers=None):  # Batched real FFT over several channels at once
+        with self._stage("perform_fft_multi", workers=workers) as stage:
+            if self.check_sampling()["irregular"]:  # Batched FFTs assume an even grid; perform_fft can switch to nufft
+                print("Warning: Time(s) is not evenly sampled; use perform_fft(mode='nufft' or 'auto') for a correct ASD.")
+            channels = list(channels or CHANNELS)
+            time = self.data["Time(s)"]
+            dt = self._sample_interval()
+
+            signals = np.empty((len(channels), len(time)), dtype=self.dtype)  # Channels x samples, filled column by column
+            for row, column in zip(signals, channels):
+                row[:] = np.asarray(self.data[column])
+
+            freq, asd = batched_asd(signals, dt, workers=workers)  # workers=-1 uses every core
+            self.channels = channels
+            self.channel_asd = asd
+            self.positive_freq = freq
+            self.select_channel(channels[0])  # Keep positive_freq and positive_asd consistent
+            stage.record(channels=len(channels), samples=signals.shape[1], output_bytes=asd.nbytes)
+        return freq, asd
+
+    def select_channel(self, signal_column):  # Point positive_asd at one row of the multi-channel result
+        self.positive_asd = self.channel_asd[self.channels.index(signal_column)]
+        self.positive_spectrum = None  # The batched path keeps no complex spectrum
+        self._result_key = None
+        self.asd = self.positive_asd
+        self.freq = self.positive_freq
+
+    def _floors(self):  # Noise floors of the current spectrum; a new spectrum starts with none
+        if self._noise_floor_asd is not self.positive_asd:
+            self._noise_floor_asd, self._noise_floors = self.positive_asd, {}
+        return self._noise_floors
+
+    def estimate_noise_floor(self, fraction=0.1, percentile=50):  # Running percentile of the ASD, reused per spectrum
+        floors = self._floors()
+        if (fraction, percentile) not in floors:
+            with self._stage("estimate_noise_floor", bins=len(self.positive_asd)):
+                floors[fraction, percentile] = noise_floor(self.positive_freq, self.positive_asd, fraction, percentile)
+        self.noise_floor = floors[fraction, percentile]
+        return self.noise_floor
+
+    def current_spectrum(self):  # Handle of the current spectrum with its noise floors, for restore_spectrum
+        return self.positive_freq, self.positive_asd, self._result_key, self._floors()
+
+    def restore_spectrum(self, spectrum):  # Make a spectrum from current_spectrum current again
+        self.positive_freq, self.positive_asd, self._result_key, self._noise_floors = spectrum
+        self._noise_floor_asd = self.positive_asd  # Floors computed from here on are kept in the handle too
+        self.freq, self.asd = self.positive_freq, self.positive_asd
+        self.positive_spectrum = None
+
+    def detect_peaks(self, min_amplitude=0.01, prominence=0.005, width=None, interactive=True,
+                     decimate=None, min_snr=None, floor_fraction=0.1, floor_percentile=50,
+                     verbose=True):  # Detect peaks in ASD; min_snr thresholds over the local noise floor
+        with self._stage("detect_peaks", bins=len(self.positive_asd), min_snr=min_snr) as stage:
+            stored = None
+            if self._result_key:  # Peak tables are stored per spectrum and threshold set
+                digest, channel, params = self._result_key
+                params = dict(params, min_amplitude=min_amplitude, prominence=prominence, width=width,
+                              min_snr=min_snr)
+                if min_snr is not None:
+                    params.update(floor_fraction=floor_fraction, floor_percentile=floor_percentile)
+                stored = self.result_store.get_peaks(digest, channel, params)
+            if stored:
+                peaks = stored["indices"]
+                prominences = stored.get("prominences")
+            else:
+                from scipy.signal import find_peaks
+                height = min_amplitude
+                if min_snr is not None:
+                    height = min_snr * self.estimate_noise_floor(floor_fraction, floor_percentile)
+                peaks, properties = find_peaks(
+                    self.positive_asd, height=height, prominence=prominence, width=width
+                )
+                prominences = properties.get("prominences")  # Only computed when thresholded on
+                if self._result_key:
+                    self.result_store.put_peaks(digest, channel, params, indices=peaks,
+                                                **({} if prominences is None else {"prominences": prominences}))
+            stage.record(peaks=len(peaks), stored=bool(stored))
+        self.peak_indices = peaks
+        self.peak_prominences = np.full(len(peaks), np.nan) if prominences is None else prominences
+        peak_frequencies = self.positive_freq[peaks]
+        peak_amplitudes = self.positive_asd[peaks]
+
+        if verbose:  # Print detected peaks
+            print("\nDetected Peaks:")
+            if len(peaks) > 0:
+                for i, (freq, amp) in enumerate(zip(peak_frequencies, peak_amplitudes)):
+                    print(f"Peak {i+1}: Frequency = {freq:.2f} Hz, Amplitude = {amp:.4f}")
+            else:
+                print("No peaks detected with the current parameters.")
+
+        if not interactive:  # Headless: no figure and no prompt
+            return peak_frequencies, peak_amplitudes
+
+        # Show the plot with current thresholds
+        import matplotlib.pyplot as plt
+        with self._stage("detect_peaks.plot", decimate=decimate):
+            plt.figure(figsize=(10, 6))
+            plt.loglog(*self._plot_spectrum(peaks, decimate), label='ASD')
+            if min_snr is not None:  # The frequency-dependent threshold
+                floor = self.estimate_noise_floor(floor_fraction, floor_percentile)
+                plt.loglog(*self._plot_spectrum(decimate=decimate, values=min_snr * floor),
+                           label=f'{min_snr:g} x noise floor')
+            if len(peaks) > 0:
+                plt.scatter(peak_frequencies, peak_amplitudes, color='red', label='Peaks')
+            plt.xlabel('Frequency (Hz)')
+            plt.ylabel('Amplitude Spectral Density (m/√Hz)')
+            plt.title(f'FFT Plot with Peaks of {self.file_name}')
+            plt.legend()
+            plt.grid(True)
+        plt.show()  # Outside the stage: an interactive window blocks until closed
+
+        # Ask the user to adjust thresholds or accept results once
+        user_input = input(
+            "\nAdjust thresholds? Type 'reset' to adjust or 'no' to accept: "
+        ).strip().lower()
+        if user_input == 'reset':
+            try:
+                if min_snr is None:
+                    min_amplitude = float(input("Enter new minimum amplitude (e.g., 0.01): "))
+                else:
+                    min_snr = float(input("Enter new minimum SNR over the noise floor (e.g., 5): "))
+                prominence = float(input("Enter new prominence threshold (e.g., 0.005): "))
+                width = input("Enter new minimum width (e.g., 1) or leave blank: ")
+                width = None if width.strip() == "" else float(width)
+                # Re-run peak detection with new thresholds
+                return self.detect_peaks(min_amplitude, prominence, width, decimate=decimate, min_snr=min_snr,
+                                         floor_fraction=floor_fraction, floor_percentile=floor_percentile)
+            except ValueError:
+                print("Invalid input. Retaining current thresholds.")
+        elif user_input == 'no':
+            print("Thresholds accepted.")
+        else:
+            print("Invalid input. Thresholds retained.")
+
+        return peak_frequencies, peak_amplitudes
+
+    def refine_peaks(self, peaks=None):  # Sub-bin frequency, amplitude and phase of each peak
+        if self.positive_spectrum is None:
+            raise ValueError("Peak refinement needs perform_fft(..., keep_spectrum=True).")
+        if peaks is None:
+            peak_indices = self.peak_indices
+        elif isinstance(peaks, tuple):  # (frequencies, amplitudes) as returned by detect_peaks
+            peak_indices = np.searchsorted(self.positive_freq, peaks[0])
+        else:
+            peak_indices = peaks
+        df = self.positive_freq[1] - self.positive_freq[0]
+        return refine_peaks(self.positive_spectrum, peak_indices, df, self.spectrum_length)
+
+    def zoom_spectrum(self, signal_column, f_start, f_stop, n_points=1024):  # High-resolution ASD over one band
+        signal = np.asarray(self.data[signal_column])
+        freq, asd, _ = zoom_asd(signal, self._sample_interval(), f_start, f_stop, n_points)
+        return freq, asd
+
+    def zoom_peaks(self, signal_column, peaks=None, half_width=None, n_points=512):  # Zoom into a band around each peak
+        if peaks is None:
+            peak_frequencies = self.positive_freq[self.peak_indices]
+        elif isinstance(peaks, tuple):  # (frequencies, amplitudes) as returned by detect_peaks
+            peak_frequencies = peaks[0]
+        else:
+            peak_frequencies = np.asarray(peaks)
+
+        df = self.positive_freq[1] - self.positive_freq[0]
+        half_width = half_width or 2 * df  # Default band: two FFT bins either side
+        zooms = []
+        for center in peak_frequencies:
+            freq, asd = self.zoom_spectrum(signal_column, max(center - half_width, 0.0),
+                                           center + half_width, n_points)
+            zooms.append({"center": center, "freq": freq, "asd": asd,
+                          "peak_frequency": freq[np.argmax(asd)], "peak_amplitude": np.max(asd)})
+        return zooms
+
+    def cross_spectra(self, channels=None, nperseg=4096, overlap=0.5, window="hann"):  # CSD and coherence of every channel pair
+        with self._stage("cross_spectra") as stage:
+            self.csd_channels = list(channels or CHANNELS)
+            signals = [np.asarray(self.data[channel]) for channel in self.csd_channels]
+            self.csd_freq, self.csd, self.coherence = cross_spectral_matrix(
+                signals, self._sample_interval(), nperseg=nperseg, overlap=overlap, window=window
+            )
+            stage.record(channels=len(signals), samples=len(signals[0]), bins=len(self.csd_freq))
+        return self.csd_freq, self.csd, self.coherence
+
+    def coherent_peaks(self, peaks=None, threshold=0.9):  # Detected peaks that are common to channel pairs
+        if peaks is None:
+            peak_frequencies = self.positive_freq[self.peak_indices]
+        elif isinstance(peaks, tuple):  # (frequencies, amplitudes) as returned by detect_peaks
+            peak_frequencies = np.asarray(peaks[0])
+        else:
+            peak_frequencies = np.asarray(peaks)
+        return coherent_peaks(self.csd_freq, self.coherence, peak_frequencies, self.csd_channels, threshold)
+
+    def track_peaks(self, tracker, label=None):  # Link the detected peaks into tracker.PeakTracker tracks
+        peaks = self.peak_indices
+        return tracker.update(self.positive_freq[peaks], self.positive_asd[peaks],
+                              label=self.file_name if label is None else label)
+
+    def peak_candidates(self):  # All local maxima with their prominences and widths, computed once per spectrum
+        if self._peak_candidates is None or self._peak_candidates.asd is not self.positive_asd:
+            self._peak_candidates = PeakCandidates(self.positive_freq, self.positive_asd)
+        return self._peak_candidates
+
+    def sweep_thresholds(self, min_amplitudes, prominences, widths=(None,)):  # Peak sets over a threshold grid
+        return self.peak_candidates().sweep(min_amplitudes, prominences, widths)
+
+    def compute_spectrograms(self, channels=None, nperseg=4096, hop=None, window="hann",
+                             out_dir=None, workers=None):  # Sliding-window STFT per channel
+        dt = self._sample_interval()
+        for channel in channels or CHANNELS:
+            out_path = None
+            if out_dir:  # Stream frames to disk instead of keeping them in memory
+                os.makedirs(out_dir, exist_ok=True)
+                out_path = os.path.join(out_dir, f"{self.file_name}_{channel}_spectrogram.npy")
+            self.spectrograms[channel] = compute_spectrogram(
+                np.asarray(self.data[channel]), dt, nperseg=nperseg, hop=hop, window=window,
+                out_path=out_path, workers=workers
+            )
+        return self.spectrograms
+
+    def plot_spectrogram(self, signal_column, save_path=None, show=True):  # Decimated time-frequency plot
+        times, freq, asd = self.spectrograms[signal_column]
+        plot_spectrogram(times, freq, asd, title=f'Spectrogram of {self.file_name} ({signal_column})',
+                         save_path=save_path, show=show)
+
+    def _plot_spectrum(self, peak_indices=None, decimate=None, values=None):  # Full or log-binned (freq, asd) for plotting
+        values = self.positive_asd if values is None else values
+        if not decimate:
+            return self.positive_freq, values
+        return decimate_spectrum(self.positive_freq, values, n_bins=decimate, keep=peak_indices)
+
+    def plot_asd(self, save_path=None, peaks=None, decimate=None, show=True):  # Plot the ASD and optionally mark peaks
+        import matplotlib.pyplot as plt
+        with self._stage("plot_asd", bins=len(self.positive_asd), decimate=decimate):
+            peak_indices = None
+            if peaks:  # Keep the marked peaks exactly when decimating
+                peak_indices = np.searchsorted(self.positive_freq, peaks[0])
+
+            plt.figure(figsize=(10, 6))
+            plt.loglog(*self._plot_spectrum(peak_indices, decimate), label='ASD')
+
+            if peaks:  # Mark peaks if provided
+                peak_frequencies, peak_amplitudes = peaks
+                plt.scatter(peak_frequencies, peak_amplitudes, color='red', label='Peaks')
+
+            plt.xlabel('Frequency (Hz)')
+            plt.ylabel('Amplitude Spectral Density (m/√Hz)')
+            plt.title(f'FFT Plot of {self.file_name}')
+            plt.legend()
+            plt.grid(True)
+
+            if save_path:  # Save the plot if a path is provided
+                plt.savefig(save_path)
+        if show:
+            plt.show()
+        else:  # Batch output: free the figure instead of displaying it
+            plt.close()
+
+
+def compare_precision(file_path, signal_column="polarized_x_a", min_amplitude=0.05, prominence=0.01):  # float32 vs float64 accuracy
+    from scipy.signal import find_peaks
+    spectra = {}
+    for dtype in (np.float64, np.float32):
+        analyzer = FFTAnalyzer(file_path, dtype=dtype)
+        analyzer.load_data()
+        analyzer.perform_fft(signal_column)
+        peaks, _ = find_peaks(analyzer.positive_asd, height=min_amplitude, prominence=prominence)
+        spectra[dtype] = (analyzer.positive_asd, analyzer.positive_freq[peaks])
+
+    reference, reference_peaks = spectra[np.float64]
+    single, single_peaks = spectra[np.float32]
+    error = np.abs(single.astype(np.float64) - reference)
+    report = {
+        "max_abs_error": float(np.max(error)),
+        "max_error_rel_to_peak": float(np.max(error) / np.max(reference)),
+        "median_rel_error": float(np.median(error / np.maximum(reference, np.finfo(np.float64).tiny))),
+        "peaks_float64": len(reference_peaks),
+        "peaks_float32": len(single_peaks),
+        "peaks_only_in_float64": sorted(set(reference_peaks) - set(single_peaks)),
+        "peaks_only_in_float32": sorted(set(single_peaks) - set(reference_peaks)),
+    }
+
+    print(f"\nfloat32 vs float64 ASD of {signal_column}:")
+    print(f"Max absolute error = {report['max_abs_error']:.3e} m/√Hz "
+          f"({report['max_error_rel_to_peak']:.2e} of the largest bin)")
+    print(f"Median relative error = {report['median_rel_error']:.2e}")
+    print(f"Peaks: {report['peaks_float64']} (float64) vs {report['peaks_float32']} (float32)")
+    return report
+
+
+def main():
+    # Step 1: Ask the user for the file path
+    file_path = input("Enter the path to your data file: ")
+
+    # Initialize FFTAnalyzer; spectra and peak tables are reused from earlier runs on the same file
+    analyzer = FFTAnalyzer(file_path, result_store=ResultStore())
+
+    # Step 2: Load the data (parsed once, then served from the binary cache)
+    try:
+        analyzer.load_data(use_cache=True)
+    except Exception as e:
+        print(f"Error loading the file: {e}")
+        exit()
+
+    # Step 3: Perform FFT on 'polarized_x_a'
+    analyzer.perform_fft(signal_column="polarized_x_a")
+
+    # Step 4: Detect peaks focusing on tall amplitudes
+    peaks = analyzer.detect_peaks(min_amplitude=0.05, prominence=0.01)
+
+    # Step 5: Plot ASD with peaks
+    analyzer.plot_asd(save_path=f"FFT_Plot_with_Peaks_{analyzer.file_name}.png", peaks=peaks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import os
+import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from fftanalysis.analyzer import FFTAnalyzer, CHANNELS
+
+PEAK_COLUMNS = ["file", "channel", "frequency", "amplitude", "prominence"]
+
+
+def find_recordings(source):  # A directory means every .lvm file inside it; anything else is a glob
+    if os.path.isdir(source):
+        source = os.path.join(source, "*.lvm")
+    return sorted(glob.glob(source))
+
+
+def channel_peaks(analyzer, channels, mode="fft", nperseg=4096, overlap=0.5, min_amplitude=0.05,
+                  prominence=0.01, width=None, workers=1, min_snr=None):  # Yields (channel, freq, asd, peaks, prominences)
+    # All channels in one batched transform, unless spectra and peaks are looked up in a result store per channel
+    batched = mode == "fft" and analyzer.result_store is None
+    if batched:
+        analyzer.perform_fft_multi(channels, workers=workers)
+
+    for channel in channels:
+        if batched:
+            analyzer.select_channel(channel)
+        else:
+            analyzer.perform_fft(channel, mode=mode, nperseg=nperseg, overlap=overlap)
+        analyzer.detect_peaks(min_amplitude=min_amplitude, prominence=prominence, width=width, interactive=False,
+                              min_snr=min_snr, verbose=False)
+        yield channel, analyzer.positive_freq, analyzer.positive_asd, analyzer.peak_indices, analyzer.peak_prominences
+
+
+def peak_rows(file_name, channel, freq, asd, peaks, prominences):  # PEAK_COLUMNS rows of one channel
+    return [(file_name, channel, freq[peak], asd[peak], prom) for peak, prom in zip(peaks, prominences)]
+
+
+def analyze_file(file_path, channels=None, mode="fft", nperseg=4096, overlap=0.5,
+                 min_amplitude=0.05, prominence=0.01, width=None, use_cache=True, min_snr=None):  # Load -> FFT -> peaks for one file
+    analyzer = FFTAnalyzer(file_path)
+    analyzer.load_data(use_cache=use_cache)
+
+    rows = []
+    # workers=1: the pool already provides the parallelism
+    for result in channel_peaks(analyzer, list(channels or CHANNELS), mode=mode, nperseg=nperseg,
+                                overlap=overlap, min_amplitude=min_amplitude, prominence=prominence,
+                                width=width, workers=1, min_snr=min_snr):
+        rows.extend(peak_rows(analyzer.file_name, *result))
+    return rows
+
+
+def peak_table(rows):  # Sorted DataFrame of PEAK_COLUMNS rows
+    import pandas as pd
+    table = pd.DataFrame(rows, columns=PEAK_COLUMNS).sort_values(["file", "channel", "frequency"])
+    return table.reset_index(drop=True)
+
+
+def write_peak_table(table, output):  # Format follows the file extension
+    if output.endswith(".parquet"):
+        table.to_parquet(output, index=False)
+    else:
+        table.to_csv(output, index=False)
+
+
+def run_batch(source, output=None, workers=None, **options):  # Analyze every matching recording in a process pool
+    files = find_recordings(source)
+    if not files:
+        print(f"No recordings found for {source}")
+        return peak_table([])
+
+    rows, analyzed = [], 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(analyze_file, path, **options): path for path in files}
+        for future in as_completed(futures):
+            try:
+                rows.extend(future.result())
+                analyzed += 1
+            except Exception as e:  # An unreadable recording is reported and left out of the table
+                print(f"Error analyzing {futures[future]}: {e!r}")
+
+    table = peak_table(rows)
+    print(f"Analyzed {analyzed} of {len(files)} files, found {len(table)} peaks.")
+    if output:
+        write_peak_table(table, output)
+        print(f"Peak table written to {output}")
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch FFT peak analysis of LVM recordings.")
+    parser.add_argument("source", help="Directory of .lvm files or a glob pattern")
+    parser.add_argument("-o", "--output", default="peaks.csv", help="Output table (.csv or .parquet)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--channels", nargs="+", default=None, choices=CHANNELS)
+    parser.add_argument("--mode", choices=["fft", "welch", "nufft", "auto"], default="fft")
+    parser.add_argument("--nperseg", type=int, default=4096, help="Welch segment length")
+    parser.add_argument("--overlap", type=float, default=0.5, help="Welch segment overlap fraction")
+    parser.add_argument("--min-amplitude", type=float, default=0.05)
+    parser.add_argument("--prominence", type=float, default=0.01)
+    parser.add_argument("--width", type=float, default=None)
+    parser.add_argument("--min-snr", type=float, default=None, help="Threshold over the local noise floor "
+                        "instead of --min-amplitude")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-parse the text files")
+    args = parser.parse_args()
+
+    run_batch(
+        args.source, output=args.output, workers=args.workers, channels=args.channels,
+        mode=args.mode, nperseg=args.nperseg, overlap=args.overlap,
+        min_amplitude=args.min_amplitude, prominence=args.prominence, width=args.width, min_snr=args.min_snr,
+        use_cache=not args.no_cache,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import os
+import argparse
+
+# Headless command line interface: python -m fftanalysis <command>, or the
+# fftanalysis script once the package is installed.
+#
+#   analyze   spectra of the channels of a recording, to .npz or .csv
+#   peaks     peak table of a recording (absolute or noise-floor thresholds)
+#   plot      ASD plot with its peaks, saved to an image file
+#   generate  synthetic recording (.lvm or .npy) from SignalGenerator
+#
+# Only argparse is imported up front. Each command imports what its own code
+# path needs when it runs, so --help and generate never load scipy.signal,
+# pandas or matplotlib, and analyze never loads matplotlib. Plots use the Agg
+# backend unless --show asks for a window.
+
+SPECTRUM_MODES = ["fft", "welch", "nufft", "auto"]
+DEFAULT_TONES = [(1.0, 50.0, 0.0), (0.5, 120.0, 0.0), (0.7, 200.0, 0.0)]  # (amplitude, frequency, phase)
+
+
+def _channels(parser, requested):  # Validate channel names without importing the analyzer up front
+    from fftanalysis.analyzer import CHANNELS
+    channels = requested or CHANNELS
+    unknown = [channel for channel in channels if channel not in CHANNELS]
+    if unknown:
+        parser.error(f"unknown channels {unknown}; choose from {CHANNELS}")
+    return list(channels)
+
+
+def _analyzer(parser, args):  # Loaded FFTAnalyzer for the recording named on the command line
+    from fftanalysis.analyzer import FFTAnalyzer
+    result_store = None
+    if args.result_store:
+        from fftanalysis.result_store import ResultStore
+        result_store = ResultStore()
+    analyzer = FFTAnalyzer(args.file, result_store=result_store)
+    try:
+        analyzer.load_data(use_cache=not args.no_cache)
+    except (OSError, ValueError) as e:  # Not an LVM recording, or unreadable
+        parser.exit(1, f"{parser.prog}: error: cannot load {args.file}: {e}\n")
+    return analyzer
+
+
+def _spectra(analyzer, channels, args):  # Yields (channel, freq, asd); plain FFTs are batched unless a store is used
+    batched = args.mode == "fft" and analyzer.result_store is None  # The store is consulted by perform_fft
+    if batched:
+        analyzer.perform_fft_multi(channels)
+    for channel in channels:
+        if batched:
+            analyzer.select_channel(channel)
+        else:
+            analyzer.perform_fft(channel, mode=args.mode, nperseg=args.nperseg, overlap=args.overlap)
+        yield channel, analyzer.positive_freq, analyzer.positive_asd
+
+
+def analyze(parser, args):
+    import numpy as np
+    channels = _channels(parser, args.channels)
+    analyzer = _analyzer(parser, args)
+    freq, spectra = None, {}
+    for channel, freq, asd in _spectra(analyzer, channels, args):
+        spectra[channel] = np.array(asd)  # select_channel returns views of one shared array
+        top = 1 + int(np.argmax(asd[1:]))  # Largest bin above DC
+        print(f"{channel}: {len(asd)} bins, df = {freq[1] - freq[0]:.4g} Hz, "
+              f"largest ASD {asd[top]:.4g} m/√Hz at {freq[top]:.2f} Hz")
+
+    if args.output:
+        if args.output.endswith(".csv"):
+            np.savetxt(args.output, np.column_stack([freq] + list(spectra.values())), delimiter=",",
+                       header=",".join(["frequency"] + channels), comments="")
+        else:
+            np.savez(args.output, freq=freq, **spectra)
+        print(f"Spectra written to {args.output}")
+
+
+def peaks(parser, args):
+    from fftanalysis.batch_analysis import channel_peaks, peak_rows, peak_table, write_peak_table
+    channels = _channels(parser, args.channels)
+    analyzer = _analyzer(parser, args)
+    rows = []
+    for result in channel_peaks(analyzer, channels, mode=args.mode, nperseg=args.nperseg, overlap=args.overlap,
+                                min_amplitude=args.min_amplitude, prominence=args.prominence,
+                                width=args.width, workers=-1, min_snr=args.min_snr):
+        rows.extend(peak_rows(analyzer.file_name, *result))
+    table = peak_table(rows)
+
+    if args.output:
+        write_peak_table(table, args.output)
+        print(f"Peak table with {len(table)} peaks written to {args.output}")
+    else:
+        print(table.to_string(index=False))
+
+
+def plot(parser, args):
+    import matplotlib
+    if not args.show:
+        matplotlib.use("Agg")  # Render straight to the file; no display needed
+    channel = _channels(parser, [args.channel])[0]
+    analyzer = _analyzer(parser, args)
+    analyzer.perform_fft(channel, mode=args.mode, nperseg=args.nperseg, overlap=args.overlap)
+    detected = None
+    if not args.no_peaks:
+        detected = analyzer.detect_peaks(min_amplitude=args.min_amplitude, prominence=args.prominence,
+                                         width=args.width, interactive=False, min_snr=args.min_snr)
+    output = args.output or f"FFT_Plot_{analyzer.file_name}_{channel}.png"
+    analyzer.plot_asd(save_path=output, peaks=detected, decimate=args.decimate or None, show=args.show)
+    print(f"Plot saved to {output}")
+
+
+def generate(parser, args):
+    tones = args.tone or DEFAULT_TONES
+    if any(len(tone) not in (2, 3) for tone in tones):
+        parser.error("--tone takes AMPLITUDE FREQUENCY [PHASE]")
+    import numpy as np
+    from fftanalysis.signal_generator import SignalGenerator
+    tones = [tuple(tone) + (0.0,) * (3 - len(tone)) for tone in tones]
+    generator = SignalGenerator(args.rate, tones=tones, noise_amplitude=args.noise, noise=args.noise_model,
+                                drift_amplitude=args.drift, n_channels=args.n_channels,
+                                channel_phases=np.arange(args.n_channels), seed=args.seed)
+    if args.output.endswith(".npy"):
+        generator.write_npy(args.output, args.samples)
+    else:
+        generator.write_lvm(args.output, args.samples)
+    print(f"Wrote {args.samples} samples of {args.n_channels} channels at {args.rate:g} Hz to {args.output}")
+
+
+def _add_spectrum_options(command):
+    command.add_argument("file", help="LVM recording")
+    command.add_argument("--mode", choices=SPECTRUM_MODES, default="fft")
+    command.add_argument("--nperseg", type=int, default=4096, help="Welch segment length")
+    command.add_argument("--overlap", type=float, default=0.5, help="Welch segment overlap fraction")
+    command.add_argument("--no-cache", action="store_true", help="Always re-parse the text file")
+    command.add_argument("--result-store", action="store_true", help="Reuse spectra and peaks of earlier runs")
+
+
+def _add_peak_options(command):
+    command.add_argument("--min-amplitude", type=float, default=0.05)
+    command.add_argument("--prominence", type=float, default=0.01)
+    command.add_argument("--width", type=float, default=None)
+    command.add_argument("--min-snr", type=float, default=None, help="Threshold over the local noise floor "
+                         "instead of --min-amplitude")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="fftanalysis", description="FFT analysis of interferometer recordings.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("analyze", help="Compute channel spectra")
+    _add_spectrum_options(command)
+    command.add_argument("--channels", nargs="+", default=None, help="Channels to transform (default: all)")
+    command.add_argument("-o", "--output", default=None, help="Spectra file (.npz, or .csv for text)")
+    command.set_defaults(run=analyze)
+
+    command = commands.add_parser("peaks", help="Detect spectral peaks")
+    _add_spectrum_options(command)
+    _add_peak_options(command)
+    command.add_argument("--channels", nargs="+", default=None, help="Channels to search (default: all)")
+    command.add_argument("-o", "--output", default=None, help="Peak table (.csv or .parquet); printed if omitted")
+    command.set_defaults(run=peaks)
+
+    command = commands.add_parser("plot", help="Plot the ASD of one channel with its peaks")
+    _add_spectrum_options(command)
+    _add_peak_options(command)
+    command.add_argument("--channel", default="polarized_x_a")
+    command.add_argument("-o", "--output", default=None, help="Image file (default: FFT_Plot_<file>_<channel>.png)")
+    command.add_argument("--decimate", type=int, default=2000, help="Log-spaced plot bins, 0 for every bin")
+    command.add_argument("--no-peaks", action="store_true", help="Plot the spectrum only")
+    command.add_argument("--show", action="store_true", help="Open a window with the default backend")
+    command.set_defaults(run=plot)
+
+    command = commands.add_parser("generate", help="Write a synthetic recording")
+    command.add_argument("output", help="Output file, .lvm text or .npy columns")
+    command.add_argument("-n", "--samples", type=int, default=100_000)
+    command.add_argument("--rate", type=float, default=1000, help="Sampling rate in Hz")
+    command.add_argument("--tone", type=float, nargs="+", action="append", metavar="VALUE",
+                         help="AMPLITUDE FREQUENCY [PHASE]; repeat for several tones")
+    command.add_argument("--noise", type=float, default=0.1, help="Noise amplitude")
+    command.add_argument("--noise-model", choices=["white", "pink"], default="white")
+    command.add_argument("--drift", type=float, default=0.0, help="Random-walk drift per sqrt(second)")
+    command.add_argument("--n-channels", type=int, default=4)
+    command.add_argument("--seed", type=int, default=None)
+    command.set_defaults(run=generate)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "file", None) and not os.path.exists(args.file):
+        parser.error(f"no such file: {args.file}")
+    args.run(parser, args)
+
+
+if __name__ == "__main__":
+    main()
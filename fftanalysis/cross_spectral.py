@@ -0,0 +1,52 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import rfft
+from fftanalysis.fft_cache import get_fft_setup
+from fftanalysis.spectral import segment_starts
+
+# Channel x channel cross-spectral density and coherence.
+#
+# The signals are cut into the same Welch segments as spectral.welch_psd. Each
+# block of segments is transformed once per channel, and every channel pair is
+# accumulated from those spectra with one einsum, so no pair recomputes an FFT.
+# CSD normalisation matches welch_psd: the diagonal is the Welch PSD of each
+# channel.
+
+
+def cross_spectral_matrix(signals, dt, nperseg=4096, overlap=0.5, window="hann",
+                          block_segments=64):  # Returns (freq, csd[C, C, F], coherence[C, C, F])
+    signals = [np.asarray(signal) for signal in signals]
+    noverlap = int(nperseg * overlap)
+    starts = segment_starts(len(signals[0]), nperseg, noverlap)
+    setup = get_fft_setup(nperseg, dt, window=window)
+    n_bins = nperseg // 2
+    frames = [sliding_window_view(signal, nperseg) for signal in signals]  # Strided views, no copies
+
+    csd = np.zeros((len(signals), len(signals), n_bins), dtype=complex)
+    for first in range(0, len(starts), block_segments):
+        block = starts[first:first + block_segments]
+        segments = np.stack([f[block] for f in frames]) * setup.window  # (channels, segments, nperseg)
+        spectra = rfft(segments, axis=-1)[..., :n_bins]
+        csd += np.einsum("isf,jsf->ijf", spectra, spectra.conj())
+    csd /= np.sum(setup.window**2) * len(starts)
+
+    power = np.real(np.einsum("iif->if", csd))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coherence = np.abs(csd)**2 / (power[:, None, :] * power[None, :, :])
+    return setup.rfreq, csd, np.nan_to_num(coherence)
+
+
+def coherent_peaks(freq, coherence, peak_frequencies, channels, threshold=0.9):  # Peaks shared by channel pairs
+    import pandas as pd
+    bins = np.clip(np.searchsorted(freq, peak_frequencies), 0, len(freq) - 1)
+    left = np.clip(bins - 1, 0, len(freq) - 1)
+    closer_left = np.abs(freq[left] - peak_frequencies) < np.abs(freq[bins] - peak_frequencies)
+    bins = np.where(closer_left, left, bins)  # Nearest bin of the (coarser) Welch grid
+
+    i, j = np.triu_indices(len(channels), k=1)
+    values = coherence[i, j][:, bins]  # (pairs, peaks)
+    rows = []
+    for pair, peak in zip(*np.nonzero(values >= threshold)):
+        rows.append((peak_frequencies[peak], freq[bins[peak]], channels[i[pair]], channels[j[pair]],
+                     values[pair, peak]))
+    return pd.DataFrame(rows, columns=["frequency", "bin_frequency", "channel_a", "channel_b", "coherence"])
@@ -0,0 +1,39 @@
+import numpy as np
+
+# Decimation for log-log spectrum plots.
+#
+# The positive-frequency axis is cut into logarithmically spaced bins and only
+# the minimum and maximum sample of each bin are kept, in frequency order. A
+# line through those samples draws the same envelope as the full spectrum, with
+# at most 2 * n_bins points, whatever the FFT length. Indices passed in keep
+# (e.g. detected peaks) are always included exactly.
+
+
+def _first_extreme(values, extremes, counts, offset):  # Index of the first sample equal to each bin's extreme
+    hits = np.flatnonzero(values == np.repeat(extremes, counts))
+    bins = np.repeat(np.arange(len(counts)), counts)[hits]
+    _, first = np.unique(bins, return_index=True)
+    return hits[first] + offset
+
+
+def log_bin_indices(freq, asd, n_bins=2000, keep=None):  # Sorted sample indices to plot
+    N = len(freq)
+    keep = np.asarray([] if keep is None else keep, dtype=np.intp)
+    start = int(np.searchsorted(freq, 0, side="right"))  # The DC bin cannot be drawn on a log axis
+    if N - start <= 2 * n_bins:
+        return np.union1d(np.arange(start, N), keep)
+
+    bounds = np.geomspace(freq[start], freq[-1], n_bins + 1)[:-1]
+    edges = np.unique(np.searchsorted(freq, bounds))  # Drops bins narrower than one FFT bin
+    edges[0] = start
+    counts = np.diff(np.append(edges, N))
+
+    values = np.asarray(asd[start:])
+    minima = _first_extreme(values, np.minimum.reduceat(values, edges - start), counts, start)
+    maxima = _first_extreme(values, np.maximum.reduceat(values, edges - start), counts, start)
+    return np.unique(np.concatenate((minima, maxima, keep)))
+
+
+def decimate_spectrum(freq, asd, n_bins=2000, keep=None):  # Reduced (freq, asd) pair for plotting
+    idx = log_bin_indices(freq, asd, n_bins=n_bins, keep=keep)
+    return np.asarray(freq[idx]), np.asarray(asd[idx])
@@ -0,0 +1,116 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+from scipy.fft import fftfreq, rfftfreq
+
+# Shared, bounded cache of per-shape FFT setup.
+#
+# Recordings come in a handful of lengths and sample rates, so the frequency
+# grids, window vectors and complex output buffers for a given
+# (N, dt, window, dtype) are built once and reused by every analysis in the
+# process. The transform plans themselves are cached inside pocketfft, which
+# numpy.fft and scipy.fft both use; reusing the same shapes keeps them warm.
+# Cached arrays are read-only. Output buffers are per thread, so concurrent
+# analyses never share scratch space, and only small ones are kept: a buffer
+# lives as long as its cache entry, and the cache is bounded by entry count, so
+# keeping a 1.6 GB buffer for N = 1e8 in every worker thread of a long-running
+# process would pin that memory for good. Above MAX_KEPT_BUFFER bytes each call
+# gets a fresh buffer, which is freed with the result; the allocation is
+# negligible next to a transform of that size.
+
+COMPLEX_TYPES = {np.dtype(np.float32): np.complex64, np.dtype(np.float64): np.complex128}
+MAX_KEPT_BUFFER = 64 * 2**20  # Largest output buffer kept per thread and shape
+
+
+def _read_only(array):
+    array.setflags(write=False)
+    return array
+
+
+class FFTSetup:
+    def __init__(self, N, dt, window, dtype):
+        self.N = N
+        self.dt = dt
+        self.dtype = np.dtype(dtype)
+        self.complex_dtype = COMPLEX_TYPES.get(self.dtype, np.complex128)
+        self._freq = None
+        self._rfreq = None
+        self.window = None
+        if window is not None:
+            from scipy.signal import get_window  # scipy.signal is slow to import; unwindowed setups skip it
+            self.window = _read_only(get_window(window, N).astype(self.dtype))
+        self._local = threading.local()
+
+    @property
+    def freq(self):  # Full fftfreq grid
+        if self._freq is None:
+            self._freq = _read_only(fftfreq(self.N, self.dt))
+        return self._freq
+
+    @property
+    def rfreq(self):  # Positive-frequency grid, [:N//2] like perform_fft
+        if self._rfreq is None:
+            self._rfreq = _read_only(rfftfreq(self.N, self.dt)[:self.N // 2])
+        return self._rfreq
+
+    def spectrum_buffer(self):  # Complex output buffer of length N, reused per thread unless it is large
+        buffer = getattr(self._local, "spectrum", None)
+        if buffer is None:
+            buffer = np.empty(self.N, dtype=self.complex_dtype)
+            if buffer.nbytes <= MAX_KEPT_BUFFER:
+                self._local.spectrum = buffer
+        return buffer
+
+
+class FFTSetupCache:
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, N, dt, window=None, dtype=np.float64):  # Look up or build the setup for one shape
+        key = (int(N), float(dt), window if window is None or isinstance(window, str) else tuple(window),
+               np.dtype(dtype).str)
+        with self._lock:
+            setup = self._entries.get(key)
+            if setup is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return setup
+            self.misses += 1
+        setup = FFTSetup(N, dt, window, dtype)
+        with self._lock:
+            self._entries[key] = setup
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:  # Evict the least recently used shape
+                self._entries.popitem(last=False)
+        return setup
+
+    def stats(self):  # Hit/miss counters for reporting
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+default_cache = FFTSetupCache()
+
+
+def get_fft_setup(N, dt, window=None, dtype=np.float64):  # Setup from the process-wide cache
+    return default_cache.get(N, dt, window=window, dtype=dtype)
+
+
+def fft_cache_stats():
+    return default_cache.stats()
@@ -0,0 +1,107 @@
+import os
+import json
+import time
+import threading
+import tracemalloc
+
+# Opt-in stage timing for FFTAnalyzer.
+#
+# An Instrumentation object records, for every stage, wall time, CPU time,
+# optionally the bytes allocated (via tracemalloc), and any sizes the stage
+# reports through record(). Hooks are called with each finished event. When an
+# analyzer has no instrumentation attached it uses NULL_STAGE, whose enter/exit
+# do nothing, so the disabled cost is one attribute check per stage.
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def record(self, **info):
+        pass
+
+
+NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    def __init__(self, instrumentation, name, info):
+        self.instrumentation = instrumentation
+        self.event = {"name": name, **info}
+
+    def record(self, **info):  # Attach sizes or other details to the running stage
+        self.event.update(info)
+
+    def __enter__(self):
+        inst = self.instrumentation
+        if inst.track_memory:
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+        self._cpu_start = time.process_time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        self.event["start_s"] = self._start - self.instrumentation.origin
+        self.event["wall_s"] = end - self._start
+        self.event["cpu_s"] = time.process_time() - self._cpu_start
+        if self.instrumentation.track_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            self.event["allocated_bytes"] = current - self._memory_start
+            self.event["peak_bytes"] = peak - self._memory_start
+        if exc_type is not None:
+            self.event["error"] = repr(exc)
+        self.event["thread"] = threading.get_ident()
+        self.instrumentation._finish(self.event)
+        return False
+
+
+class Instrumentation:
+    def __init__(self, track_memory=False, hooks=None):
+        self.track_memory = track_memory  # tracemalloc slows allocation-heavy code; off unless asked for
+        self.hooks = list(hooks or [])
+        self.events = []
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def add_hook(self, hook):  # hook(event_dict) runs after every stage
+        self.hooks.append(hook)
+
+    def stage(self, name, **info):
+        return _Stage(self, name, info)
+
+    def _finish(self, event):
+        with self._lock:
+            self.events.append(event)
+        for hook in self.hooks:
+            hook(event)
+
+    def summary(self):  # Total wall and CPU time per stage name
+        totals = {}
+        for event in self.events:
+            entry = totals.setdefault(event["name"], {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0})
+            entry["calls"] += 1
+            entry["wall_s"] += event["wall_s"]
+            entry["cpu_s"] += event["cpu_s"]
+        return totals
+
+    def to_json(self, path):
+        with open(path, "w") as f:
+            json.dump({"events": self.events, "summary": self.summary()}, f, indent=2, default=str)
+
+    def to_chrome_trace(self, path):  # Loadable in chrome://tracing or Perfetto
+        trace = []
+        for event in self.events:
+            args = {k: v for k, v in event.items() if k not in ("name", "start_s", "wall_s", "thread")}
+            trace.append({
+                "name": event["name"], "ph": "X", "pid": os.getpid(), "tid": event["thread"],
+                "ts": event["start_s"] * 1e6, "dur": event["wall_s"] * 1e6, "args": args,
+            })
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f, default=str)
@@ -0,0 +1,134 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+from fftanalysis.lvm_reader import LVMData, read_lvm
+
+# Binary columnar cache for LabVIEW .lvm recordings.
+#
+# Each recording is parsed once and stored as one raw, contiguous file per
+# channel plus a small meta.json. Later loads return zero-copy np.memmap views.
+# An entry is valid while the source file's size and mtime match; if only the
+# mtime changed (e.g. the file was touched or copied), the content hash decides.
+# The first column (time) is always float64; the other columns are stored in the
+# requested dtype, with a separate entry per dtype. The LVM header metadata
+# (sample interval, segments) is kept in meta.json and returned with the columns.
+
+CACHE_VERSION = 3
+HASH_CHUNK = 1 << 22  # Read 4 MiB at a time when hashing
+
+
+def default_cache_dir():  # Cache location, overridable with LVM_CACHE_DIR
+    return os.environ.get(
+        "LVM_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "lvm_cache")
+    )
+
+
+def file_digest(file_path):  # Content hash of the whole file
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _entry_dir(file_path, cache_dir, dtype):  # One directory per source path and dtype
+    path_key = hashlib.blake2b(os.path.abspath(file_path).encode(), digest_size=8).hexdigest()
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(cache_dir, f"{stem}-{path_key}-{np.dtype(dtype).name}")
+
+
+def _column_file(entry_dir, index):
+    return os.path.join(entry_dir, f"col{index}.bin")
+
+
+def _read_meta(entry_dir):
+    try:
+        with open(os.path.join(entry_dir, "meta.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _is_valid(meta, stat, file_path, names):  # Check size, mtime and content hash
+    if meta is None or meta.get("version") != CACHE_VERSION:
+        return False
+    if meta["names"] != list(names) or meta["size"] != stat.st_size:
+        return False
+    if meta["mtime_ns"] == stat.st_mtime_ns:
+        return True
+    return meta["digest"] == file_digest(file_path)
+
+
+def _column_dtypes(names, dtype):  # Time stays float64 so long records keep their resolution
+    return ["float64"] + [np.dtype(dtype).name] * (len(names) - 1)
+
+
+def _build_entry(file_path, names, entry_dir, stat, dtype):  # Parse the text file once and write the columns
+    dtypes = _column_dtypes(names, dtype)
+    data = read_lvm(file_path, names=names, dtype=dtype)
+    parent = os.path.dirname(entry_dir)
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=parent)
+    try:
+        for i, (name, column_dtype) in enumerate(zip(names, dtypes)):
+            np.ascontiguousarray(data[name], dtype=column_dtype).tofile(_column_file(tmp_dir, i))
+        meta = {
+            "version": CACHE_VERSION,
+            "source": os.path.abspath(file_path),
+            "names": list(names),
+            "length": len(data[names[0]]),
+            "header": data.header,
+            "segments": data.segments,
+            "sample_interval": data.sample_interval,
+            "dtypes": dtypes,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": file_digest(file_path),
+        }
+        with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(tmp_dir, entry_dir)  # Publish the finished entry atomically
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return meta
+
+
+def _refresh_mtime(entry_dir, meta, stat):  # Same content, new mtime: skip hashing next time
+    meta["mtime_ns"] = stat.st_mtime_ns
+    try:
+        with open(os.path.join(entry_dir, "meta.json"), "w") as f:
+            json.dump(meta, f)
+    except OSError:
+        pass
+
+
+def load_lvm_cached(file_path, names, cache_dir=None, dtype=np.float64):  # LVMData of read-only np.memmap columns
+    cache_dir = cache_dir or default_cache_dir()
+    entry_dir = _entry_dir(file_path, cache_dir, dtype)
+    stat = os.stat(file_path)
+    meta = _read_meta(entry_dir)
+
+    if not _is_valid(meta, stat, file_path, names):
+        meta = _build_entry(file_path, names, entry_dir, stat, dtype)
+    elif meta["mtime_ns"] != stat.st_mtime_ns:
+        _refresh_mtime(entry_dir, meta, stat)
+
+    columns = {}
+    for i, (name, column_dtype) in enumerate(zip(meta["names"], meta["dtypes"])):
+        if meta["length"] == 0:  # np.memmap cannot map an empty file
+            columns[name] = np.empty(0, dtype=column_dtype)
+        else:
+            columns[name] = np.memmap(
+                _column_file(entry_dir, i), dtype=column_dtype, mode="r", shape=(meta["length"],)
+            )
+    return LVMData(columns, header=meta["header"], segments=meta["segments"],
+                   sample_interval=meta["sample_interval"])
+
+
+def clear_cache(cache_dir=None):  # Remove every cached recording
+    shutil.rmtree(cache_dir or default_cache_dir(), ignore_errors=True)
@@ -0,0 +1,220 @@
+import io
+import os
+import mmap
+import numpy as np
+
+# Reader for LabVIEW measurement (.lvm) text files.
+#
+# The file header and every segment header are parsed once, so the sample
+# interval (Delta_X), channel names and segment boundaries come from the file
+# instead of being guessed from the data. Files without a LabVIEW header (plain
+# tab-separated columns with ';' comment lines) are read the same way.
+#
+# The numeric body of each segment goes through one pandas C tokenizer call,
+# which reads it straight from the memory map (through a bounded file-like
+# view, so the text is never copied as a whole) and keeps only the requested
+# columns. Single-segment files need no further copy; multi-segment files
+# concatenate their segments.
+#
+# The returned LVMData always starts with a time column; when the file has no
+# X column (X_Columns = No) it is synthesised from X0 and Delta_X.
+
+END_OF_HEADER = b"***End_of_Header***"
+LABVIEW_MAGIC = b"LabVIEW Measurement"
+SEPARATORS = {"Tab": "\t", "Comma": ","}
+READ_BUFFER = 2**20  # Bytes handed to the tokenizer per read
+
+
+class LVMData(dict):  # {column name: array} plus the header metadata
+    def __init__(self, columns, header=None, segments=None, sample_interval=None):
+        super().__init__(columns)
+        self.header = header or {}  # File header fields
+        self.segments = segments or []  # One dict per segment: start, length and its header fields
+        self.sample_interval = sample_interval  # Delta_X of the first channel, None for headerless files
+
+    @property
+    def sample_rate(self):
+        return None if self.sample_interval is None else 1.0 / self.sample_interval
+
+
+def _header_fields(block, separator):  # "Key<SEP>value<SEP>value..." lines -> {key: [values]}
+    fields = {}
+    for line in block.decode("latin-1").splitlines():
+        parts = [part.strip() for part in line.split(separator)]
+        if parts and parts[0] and parts[0] != END_OF_HEADER.decode():
+            fields[parts[0]] = [part for part in parts[1:] if part]
+    return fields
+
+
+def _line_end(mm, pos):  # Index just past the line starting at pos
+    end = mm.find(b"\n", pos)
+    return len(mm) if end < 0 else end + 1
+
+
+def _skip_comments(mm, pos):  # Skip blank and ';' comment lines
+    while pos < len(mm):
+        end = _line_end(mm, pos)
+        line = mm[pos:end].strip()
+        if line and not line.startswith(b";"):
+            break
+        pos = end
+    return pos
+
+
+def _file_header(mm):  # (file header fields, field separator, decimal separator)
+    header = {}
+    separator = "\t"
+    if mm[:len(LABVIEW_MAGIC)] == LABVIEW_MAGIC:
+        # The header is written with the file's own separator, which follows the magic on the first line
+        first = chr(mm[len(LABVIEW_MAGIC)]) if len(mm) > len(LABVIEW_MAGIC) else separator
+        separator = first if first in SEPARATORS.values() else separator
+        header = _header_fields(mm[:mm.find(END_OF_HEADER)], separator)
+        separator = SEPARATORS.get((header.get("Separator") or [None])[0], separator)
+    return header, separator, (header.get("Decimal_Separator") or ["."])[0]
+
+
+def _scan_segments(mm, separator):  # [(segment header, column names, body start, body end)]
+    pos = 0
+    labview = mm[:len(LABVIEW_MAGIC)] == LABVIEW_MAGIC
+    if labview:
+        pos = _line_end(mm, mm.find(END_OF_HEADER))
+
+    segments = []
+    while True:
+        pos = _skip_comments(mm, pos)
+        if pos >= len(mm):
+            break
+        header, names = {}, None
+        if mm[pos:pos + len(b"Channels")] == b"Channels":  # Segment headers start with the channel count
+            marker = mm.find(END_OF_HEADER, pos)
+            header = _header_fields(mm[pos:marker], separator)
+            pos = _skip_comments(mm, _line_end(mm, marker))
+            names_end = _line_end(mm, pos)
+            names = mm[pos:names_end].decode("latin-1").rstrip("\r\n").split(separator)
+            pos = names_end
+
+        end = mm.find(b"\nChannels", pos) if labview else -1  # Data runs up to the next segment header
+        end = len(mm) if end < 0 else end + 1
+        segments.append((header, names, pos, end))
+        pos = end
+    return segments
+
+
+class _SegmentFile(io.RawIOBase):  # Read-only file view of bytes [start, end) of the memory map
+    def __init__(self, mm, start, end):
+        self.mm = mm
+        self.pos = start
+        self.end = end
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = max(0, min(len(buffer), self.end - self.pos))
+        buffer[:n] = self.mm[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+
+def _unique(names):  # Multi X column files repeat X_Value; number the repeats
+    seen = {}
+    unique = []
+    for name in names:
+        seen[name] = seen.get(name, 0) + 1
+        unique.append(name if seen[name] == 1 else f"{name} {seen[name] - 1}")
+    return unique
+
+
+def _number(text, decimal):
+    return float(text.replace(decimal, "."))
+
+
+def _segment_columns(names, mm, start, separator):  # File column names, time first
+    if names is None:  # Headerless: count the fields of the first data line
+        line = mm[start:_line_end(mm, start)].decode("latin-1").rstrip("\r\n")
+        names = ["Time"] + [f"Column {i}" for i in range(1, len(line.split(separator)))]
+    names = [name.strip() for name in names]
+    while names and names[-1] in ("", "Comment"):  # Trailing comment column is not numeric
+        names.pop()
+    return _unique(names)
+
+
+def read_lvm_header(file_path):  # (file header, [segment header with column names]) without decoding data
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        file_header, separator, _ = _file_header(mm)
+        segments = [dict(header, names=names) for header, names, _, _ in _scan_segments(mm, separator)]
+    return file_header, segments
+
+
+def read_lvm(file_path, names=None, usecols=None, dtype=np.float64):  # LVMData of the requested columns; time stays float64
+    import pandas as pd  # Only decoding needs the C tokenizer; read_lvm_header does without it
+    if os.path.getsize(file_path) == 0:  # mmap cannot map an empty file
+        raise ValueError(f"Empty LVM file: {file_path}")
+
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        file_header, separator, decimal = _file_header(mm)
+        has_x = (file_header.get("X_Columns") or ["One"])[0] != "No"
+        scanned = _scan_segments(mm, separator)
+        if not scanned:
+            raise ValueError(f"No data in LVM file: {file_path}")
+
+        _, file_names, start, _ = scanned[0]
+        file_columns = _segment_columns(file_names, mm, start, separator)
+        if not has_x:
+            file_columns = ["Time"] + file_columns
+        columns = list(names) if names is not None else file_columns
+        if len(columns) > len(file_columns):
+            raise ValueError(f"{len(columns)} names given for {len(file_columns)} columns.")
+        missing = set(usecols or ()) - set(columns)
+        if missing:
+            raise ValueError(f"Unknown LVM columns: {sorted(missing)}")
+        # The time column is always loaded; positions count it even when the file has none
+        positions = [0] + [i for i, name in enumerate(columns) if i and (usecols is None or name in usecols)]
+        read_positions = positions if has_x else positions[1:]
+        text_columns = [p - (not has_x) for p in read_positions]  # Column numbers in the text
+        # Channels are converted by the tokenizer as it goes, so no float64 copy of them is ever built
+        dtypes = {c: np.float64 if p == 0 else dtype for c, p in zip(text_columns, read_positions)}
+
+        parts = [[] for _ in positions]
+        segments = []
+        filled = 0
+        for header, _, start, end in scanned:
+            try:
+                values = pd.read_csv(
+                    io.BufferedReader(_SegmentFile(mm, start, end), buffer_size=READ_BUFFER), sep=separator,
+                    header=None, comment=";", usecols=text_columns or [0], dtype=dtypes or np.float64, decimal=decimal,
+                    engine="c",
+                )  # usecols=[0] only counts the rows when no text column is wanted
+            except pd.errors.EmptyDataError:  # Only blank or comment lines in this segment
+                values = pd.DataFrame({c: np.empty(0, dtype=dtypes[c]) for c in text_columns})
+            length = len(values)
+            columns_read = [values[c].to_numpy() for c in text_columns]
+            if not has_x:  # Time from X0 and Delta_X of the first channel
+                x0 = _number((header.get("X0") or ["0"])[0], decimal)
+                dx = _number((header.get("Delta_X") or ["1"])[0], decimal)
+                columns_read = [x0 + dx * np.arange(length)] + columns_read
+            for part, column in zip(parts, columns_read):
+                part.append(column)
+            segments.append(dict(header, start=filled, length=length))
+            filled += length
+
+    data = {columns[p]: part[0] if len(part) == 1 else np.concatenate(part) for p, part in zip(positions, parts)}
+    delta_x = segments[0].get("Delta_X")
+    interval = _number(delta_x[0], decimal) if delta_x else None
+    return LVMData(data, header=file_header, segments=segments, sample_interval=interval)
+
+
+def select_columns(data, names):  # LVMData with only the named columns, keeping the metadata
+    missing = set(names) - set(data)
+    if missing:
+        raise ValueError(f"Unknown LVM columns: {sorted(missing)}")
+    return LVMData({name: data[name] for name in data if name in names}, header=data.header,
+                   segments=data.segments, sample_interval=data.sample_interval)
+
+
+def sample_interval(data, time_column):  # Header Delta_X when known, else the step over the whole time span
+    interval = getattr(data, "sample_interval", None)
+    if interval:
+        return interval
+    from fftanalysis.nufft import sampling_irregularity  # Same estimate as FFTAnalyzer; one printed step can be off by its last digit
+    return sampling_irregularity(data[time_column])["dt"]
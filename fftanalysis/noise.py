@@ -0,0 +1,51 @@
+import numpy as np
+
+# Local noise floor of an ASD and SNR-based peak selection.
+#
+# Interferometer spectra fall roughly as 1/f, so a single height threshold
+# either floods the low end or misses lines at high frequency. The floor here
+# is a running percentile (the median by default) whose window grows in
+# proportion to frequency: at f it spans about fraction * f. The spectrum is cut
+# into logarithmically spaced bands with one window length each, and every band
+# goes through scipy's 1-D rank filter (SciPy 1.15 and later; older releases
+# fall back to the generic n-D filter, which is far too slow at these window
+# lengths), which keeps the window in a sorted sliding structure (O(log w) per
+# bin), so tens of millions of bins cost a few passes rather than a sort per bin. Windows stop growing at max_window bins,
+# which bounds the per-bin cost (a few seconds for 2e7 bins); thousands of bins
+# are already plenty to estimate a percentile. Narrow lines cover a small part
+# of each window and barely move the percentile.
+
+BAND_GROWTH = 2 ** 0.25  # Window length ratio between consecutive bands
+MAX_WINDOW = 4001  # Default cap on the window length, in bins
+
+
+def _odd(n):
+    return int(n) | 1
+
+
+def noise_floor(freq, asd, fraction=0.1, percentile=50, min_window=9, max_window=MAX_WINDOW):  # Floor per bin, same shape as asd
+    from scipy.ndimage import percentile_filter
+    asd = np.asarray(asd)
+    n = len(asd)
+    df = freq[1] - freq[0]
+    max_window = _odd(min(max_window, n))
+    windows = np.clip(fraction * np.asarray(freq) / df, min_window, max_window)  # Window length in bins
+    band = np.floor(np.log(windows / min_window) / np.log(BAND_GROWTH)).astype(np.intp)
+
+    floor = np.empty_like(asd)
+    edges = np.flatnonzero(np.diff(band)) + 1  # Band boundaries; windows only grow with frequency
+    for lo, hi in zip(np.concatenate(([0], edges)), np.concatenate((edges, [n]))):
+        size = _odd(min(min_window * BAND_GROWTH ** band[lo], max_window))
+        half = size // 2
+        start, stop = max(lo - half, 0), min(hi + half, n)  # Neighbours the windows reach into
+        # Mirrored ends keep the noise statistics; "nearest" would repeat one edge value
+        filtered = percentile_filter(np.asarray(asd[start:stop]), percentile, size=size, mode="reflect")
+        floor[lo:hi] = filtered[lo - start:hi - start]
+    return floor
+
+
+def snr_peaks(asd, floor, min_snr=5.0, prominence=None, width=None):  # (peak indices, their SNR over the floor)
+    from scipy.signal import find_peaks
+    asd = np.asarray(asd)
+    peaks, _ = find_peaks(asd, height=min_snr * floor, prominence=prominence, width=width)
+    return peaks, asd[peaks] / floor[peaks]
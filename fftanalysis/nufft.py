@@ -0,0 +1,111 @@
+import numpy as np
+from scipy.fft import rfft, next_fast_len
+
+# Spectra of non-uniformly sampled recordings.
+#
+# Dropped samples and jittered timestamps break the evenly-spaced assumption of
+# the FFT path. Here the spectrum X(f_k) = sum_j x_j exp(-2j*pi*f_k*t_j) is
+# evaluated on the same frequency grid the FFT would use (df = 1 / (N dt) for
+# the N samples the recording would have without gaps) with a type-1
+# non-uniform FFT, using Gaussian gridding (Greengard & Lee, SIAM Review 2004):
+#
+#   1. spread every sample onto an oversampled uniform grid with a truncated
+#      Gaussian (fast Gaussian gridding: three exponentials per sample),
+#   2. FFT the grid,
+#   3. divide out the Gaussian's transform.
+#
+# Cost is O(n * spread + N log N) instead of the O(n * F) of a direct sum or a
+# Lomb-Scargle periodogram. The ASD uses the same |X| / sqrt(n) normalisation
+# as perform_fft, with n the number of samples actually present.
+
+OVERSAMPLING = 2
+CHECK_BLOCK = 1 << 20  # Time stamps differenced per block when checking the sampling
+MAX_DECIMALS = 9  # Finer printed time stamps are treated as exact
+
+
+def time_resolution(time, n=1000):  # Decimal step the time stamps were printed with, 0.0 when finer
+    head = np.abs(np.asarray(time[:n], dtype=np.float64))
+    for decimals in range(MAX_DECIMALS + 1):
+        scaled = head * 10.0**decimals
+        if np.all(np.abs(scaled - np.rint(scaled)) <= 1e-3):
+            return 10.0**-decimals
+    return 0.0
+
+
+def sampling_irregularity(time, dt=None, rtol=1e-3):  # Nominal step, timing jitter and gaps of a time column
+    time = np.asarray(time)
+    nominal = dt
+    if nominal is None:  # Steps counted over the first block (median step is robust to gaps), then its span
+        steps = np.diff(time[:CHECK_BLOCK + 1])
+        whole = np.rint(steps / np.median(steps))
+        nominal = float((time[len(steps)] - time[0]) / np.sum(whole))
+    jitter = 0.0
+    gaps = missing = total = 0
+    for start in range(0, len(time) - 1, CHECK_BLOCK):
+        steps = np.diff(time[start:start + CHECK_BLOCK + 1])
+        whole = np.rint(steps / nominal)  # Steps in units of dt; more than one means dropped samples
+        jitter = max(jitter, float(np.max(np.abs(steps - whole * nominal))))
+        gaps += int(np.count_nonzero(whole > 1))
+        missing += int(np.sum(whole[whole > 1] - 1))
+        total += int(np.sum(whole))
+    if dt is None and total:  # Span over the whole record: rounding of single stamps averages out
+        dt = float((time[-1] - time[0]) / total)
+    dt = nominal if dt is None else dt
+    # Inferred from the first stamps only, so capped well below dt: a clean head must not hide later jitter
+    resolution = min(time_resolution(time), 0.1 * dt)
+    return {
+        "dt": dt,
+        "jitter": jitter / dt,  # Largest timing error relative to dt
+        "resolution": resolution,
+        "gaps": gaps,
+        "missing": missing,  # Samples lost in the gaps
+        # Printed time stamps are off by up to one resolution step; only larger errors are jitter
+        "irregular": gaps > 0 or jitter > rtol * dt + resolution,
+    }
+
+
+def spread_width(tolerance):  # Grid points either side of a sample for the requested accuracy
+    return max(2, int(np.ceil(-np.log10(tolerance))))
+
+
+def nufft1(theta, values, n_modes, tolerance=1e-9):  # sum_j values_j exp(-1j k theta_j) for k = 0..n_modes-1
+    theta = np.mod(np.asarray(theta, dtype=np.float64), 2 * np.pi)
+    values = np.asarray(values, dtype=np.float64)
+    width = spread_width(tolerance)
+    grid_size = next_fast_len(OVERSAMPLING * 2 * n_modes)  # Oversampled grid for 2 * n_modes modes
+    R = grid_size / (2 * n_modes)
+    tau = np.pi * width / ((2 * n_modes)**2 * R * (R - 0.5))
+    h = 2 * np.pi / grid_size
+
+    # exp(-(d - l h)^2 / 4 tau) = E1 * E2^l * E3[l] with d the offset from the nearest grid point below
+    m0 = np.floor(theta / h).astype(np.intp)
+    d = theta - m0 * h
+    E1 = values * np.exp(-d**2 / (4 * tau))
+    E2 = np.exp(d * h / (2 * tau))
+    offsets = np.arange(-width + 1, width + 1)
+    E3 = np.exp(-(offsets * h)**2 / (4 * tau))
+
+    padded = np.zeros(grid_size + 2 * width - 1)  # Grid index m lands at m + width - 1 before wrapping
+    weights = E1 * E2**offsets[0]
+    for l, e3 in zip(offsets, E3):
+        padded[l + width - 1:l + width - 1 + grid_size] += np.bincount(m0, weights * e3, minlength=grid_size)
+        weights *= E2
+    grid = padded[width - 1:width - 1 + grid_size].copy()
+    grid[grid_size - (width - 1):] += padded[:width - 1]
+    grid[:width] += padded[width - 1 + grid_size:]
+
+    k = np.arange(n_modes)
+    return rfft(grid)[:n_modes] / grid_size * np.sqrt(np.pi / tau) * np.exp(k**2 * tau)
+
+
+def nufft_asd(time, signal, dt=None, tolerance=1e-9):  # (freq, asd) on the FFT grid of the gap-free recording
+    time = np.asarray(time, dtype=np.float64)
+    signal = np.asarray(signal)
+    if dt is None:
+        dt = sampling_irregularity(time)["dt"]
+    N = int(np.rint((time[-1] - time[0]) / dt)) + 1  # Samples the recording would have without gaps
+    theta = 2 * np.pi * (time - time[0]) / (N * dt)
+    spectrum = nufft1(theta, signal, N // 2, tolerance)
+    freq = np.arange(N // 2) / (N * dt)  # Same values as fftfreq(N, dt)[:N//2]
+    asd = np.abs(spectrum) / np.sqrt(len(signal))
+    return freq, asd.astype(np.result_type(signal.dtype, np.float32), copy=False)
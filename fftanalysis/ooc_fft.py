@@ -0,0 +1,94 @@
+import os
+import tempfile
+import numpy as np
+from scipy.fft import fft
+
+# Out-of-core FFT for recordings larger than RAM.
+#
+# Four-step decomposition with N = N1 * N2, viewing the signal as an N1 x N2
+# row-major matrix x2d[n1, n2] = x[N2 * n1 + n2]:
+#
+#   1. FFT each column over n1, multiply by the twiddle exp(-2j*pi*n2*k1/N) and
+#      store the result transposed in an on-disk scratch matrix B[n2, k1].
+#   2. FFT each column of B over n2; the result at [k2, k1] is X[k1 + N1 * k2].
+#
+# Both passes work on column blocks sized to fit memory_budget, so resident
+# memory is bounded by the budget rather than by N. The output is the same
+# |X| / sqrt(N) ASD that perform_fft computes (positive half only), written to
+# memory-mapped files. Without a scratch_dir the files are unlinked as soon as
+# they are mapped, so the disk space is released with the returned arrays; with
+# one, asd.f64 and freq.f64 are left there for the caller.
+
+BYTES_PER_ELEMENT = 48  # One complex128 block plus transform output and twiddles
+
+
+def split_length(N):  # N1 * N2 == N with N1 the divisor closest to sqrt(N)
+    root = int(np.sqrt(N))
+    for N1 in range(root, 0, -1):
+        if N % N1 == 0:
+            return N1, N // N1
+    return 1, N
+
+
+def _block_columns(rows, memory_budget):
+    columns = memory_budget // (BYTES_PER_ELEMENT * rows)
+    if columns < 1:
+        raise ValueError(f"Memory budget of {memory_budget} bytes cannot hold one column of {rows} samples; "
+                         "the signal length has no suitable factorisation.")
+    return int(columns)
+
+
+def _twiddles(k1, n2, N):  # exp(-2j*pi*k1*n2/N) with the product reduced mod N to keep precision
+    return np.exp(-2j * np.pi * (np.outer(k1, n2) % N) / N)
+
+
+def _scratch_array(scratch_dir, name, dtype, shape, owned):  # Writable memmap in the scratch directory
+    path = os.path.join(scratch_dir, name)
+    array = np.memmap(path, dtype=dtype, mode="w+", shape=shape)
+    if owned:  # Unlinked at once: the mapping keeps the data until the array is garbage collected
+        os.remove(path)
+    return array
+
+
+def out_of_core_asd(signal, dt, scratch_dir=None, memory_budget=256 * 2**20):  # Returns memmapped (freq, asd)
+    N = len(signal)
+    N1, N2 = split_length(N)
+    owned = scratch_dir is None  # A private temporary directory leaves nothing behind
+    scratch_dir = tempfile.mkdtemp(prefix="ooc_fft_") if owned else scratch_dir
+    os.makedirs(scratch_dir, exist_ok=True)
+    try:
+        x2d = np.asarray(signal)[:N].reshape(N1, N2)  # A view; memmapped input stays on disk
+
+        B = _scratch_array(scratch_dir, "stage1.c128", np.complex128, (N2, N1), owned)
+        k1 = np.arange(N1)
+        block = _block_columns(N1, memory_budget)
+        for c0 in range(0, N2, block):  # Pass 1: length-N1 transforms down the columns
+            c1 = min(c0 + block, N2)
+            A = fft(np.asarray(x2d[:, c0:c1], dtype=np.float64), axis=0)
+            A *= _twiddles(k1, np.arange(c0, c1), N)
+            B[c0:c1] = A.T
+
+        rows = -(-(N // 2) // N1)  # Rows of out2d holding the positive half, X[0 .. N//2 - 1]
+        asd = _scratch_array(scratch_dir, "asd.f64", np.float64, (rows * N1,), owned)
+        out2d = asd.reshape(rows, N1)  # out2d[k2, k1] = |X[k1 + N1 * k2]|
+        scale = 1 / np.sqrt(N)
+        block = _block_columns(N2, memory_budget)
+        for k0 in range(0, N1, block):  # Pass 2: length-N2 transforms down the columns of B
+            k_end = min(k0 + block, N1)
+            Y = fft(np.asarray(B[:, k0:k_end]), axis=0)
+            out2d[:, k0:k_end] = np.abs(Y[:rows]) * scale
+        asd.flush()
+        del B
+        if not owned:
+            os.remove(os.path.join(scratch_dir, "stage1.c128"))
+
+        freq = _scratch_array(scratch_dir, "freq.f64", np.float64, (N // 2,), owned)
+        chunk = max(1, memory_budget // 8)
+        for start in range(0, N // 2, chunk):  # Same values as fftfreq(N, dt)[:N//2]
+            stop = min(start + chunk, N // 2)
+            freq[start:stop] = np.arange(start, stop) / (N * dt)
+        freq.flush()
+    finally:
+        if owned:
+            os.rmdir(scratch_dir)  # Empty: its files were unlinked when mapped
+    return freq, asd[:N // 2]
@@ -0,0 +1,32 @@
+import numpy as np
+
+# Sub-bin frequency, amplitude and phase of spectral peaks.
+#
+# The three complex FFT values around each peak bin give its fractional bin
+# offset delta without any zero padding (Jacobsen's estimator, which is
+# unbiased for the rectangular window used by perform_fft). A tone between
+# bins is attenuated by sinc(delta) and phase-shifted by pi * delta * (N - 1) / N,
+# and both are corrected here. Parabolic fits to the magnitudes are not offered:
+# on a rectangular window they are biased by up to a tenth of a bin, which
+# the amplitude and phase corrections would then amplify.
+
+
+def bin_offsets(spectrum, k):  # Fractional offset of the true peak from bin k
+    a, b, c = spectrum[k - 1], spectrum[k], spectrum[k + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta = np.real((a - c) / (2 * b - a - c))
+    return np.clip(np.nan_to_num(delta), -0.5, 0.5)
+
+
+def refine_peaks(spectrum, peak_indices, df, N):  # Vectorized refinement of every peak
+    k = np.clip(np.asarray(peak_indices, dtype=np.intp), 1, len(spectrum) - 2)  # Neighbours must exist
+    delta = bin_offsets(spectrum, k)
+    magnitude = np.abs(spectrum[k]) / np.abs(np.sinc(delta))  # Undo the scalloping loss
+    phase = np.angle(spectrum[k]) - np.pi * delta * (N - 1) / N
+    return {
+        "frequency": (k + delta) * df,
+        "amplitude": magnitude / np.sqrt(N),  # Same units as positive_asd
+        "tone_amplitude": 2 * magnitude / N,  # Peak amplitude of the sinusoid
+        "phase": np.angle(np.exp(1j * phase)),  # Wrapped to (-pi, pi]
+        "offset": delta,
+    }
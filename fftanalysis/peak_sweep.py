@@ -0,0 +1,62 @@
+import numpy as np
+
+# Threshold tuning without re-running find_peaks.
+#
+# Every local maximum of the ASD is found once, together with its height,
+# prominence and width. find_peaks(height=h, prominence=p, width=w) keeps exactly
+# the candidates with height >= h, prominence >= p and width >= w, so any grid
+# of thresholds can be answered with boolean masks over these arrays.
+
+MAX_MASK_ELEMENTS = 1 << 24  # Bound on (grid points x candidates) per vectorized block
+
+
+def _lower_bound(value):  # None means "no condition", as in find_peaks
+    return -np.inf if value is None else value
+
+
+class PeakCandidates:
+    def __init__(self, freq, asd, rel_height=0.5):
+        from scipy.signal import find_peaks, peak_prominences, peak_widths
+        self.freq = freq
+        self.asd = asd
+        self.indices, _ = find_peaks(asd)  # Every local maximum, no thresholds
+        prominence_data = peak_prominences(asd, self.indices)
+        self.prominences = prominence_data[0]
+        self.widths = peak_widths(asd, self.indices, rel_height=rel_height,
+                                  prominence_data=prominence_data)[0]
+        self.heights = asd[self.indices]
+        self.frequencies = freq[self.indices]
+
+    def __len__(self):
+        return len(self.indices)
+
+    def select(self, min_amplitude=None, prominence=None, width=None):  # Same peaks find_peaks would return
+        mask = self.heights >= _lower_bound(min_amplitude)
+        mask &= self.prominences >= _lower_bound(prominence)
+        mask &= self.widths >= _lower_bound(width)
+        return self.indices[mask]
+
+    def sweep(self, min_amplitudes, prominences, widths=(None,)):  # Peak set for every grid combination
+        import pandas as pd
+        grid = np.array(
+            [(h, p, w) for h in min_amplitudes for p in prominences for w in widths], dtype=object
+        )
+        bounds = np.array([[_lower_bound(v) for v in row] for row in grid], dtype=float)
+
+        block = max(1, MAX_MASK_ELEMENTS // max(1, len(self)))
+        masks = []
+        for start in range(0, len(bounds), block):  # Broadcast (grid block x candidates) comparisons
+            b = bounds[start:start + block]
+            mask = self.heights >= b[:, 0:1]
+            mask &= self.prominences >= b[:, 1:2]
+            mask &= self.widths >= b[:, 2:3]
+            masks.append(mask)
+        masks = np.concatenate(masks) if masks else np.zeros((0, len(self)), dtype=bool)
+
+        return pd.DataFrame({
+            "min_amplitude": grid[:, 0] if len(grid) else [],
+            "prominence": grid[:, 1] if len(grid) else [],
+            "width": grid[:, 2] if len(grid) else [],
+            "n_peaks": masks.sum(axis=1),
+            "peak_frequencies": [tuple(self.frequencies[m]) for m in masks],
+        })
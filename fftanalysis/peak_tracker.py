@@ -0,0 +1,119 @@
+import numpy as np
+
+# Linking detected peaks into tracks across segments or files.
+#
+# Each update() is one step (a spectrogram frame, a Welch segment, a file of a
+# campaign). The active tracks are kept with their last frequency; new peaks
+# are located in the sorted track frequencies with searchsorted, so each peak
+# is only compared with its two neighbours. Candidate pairs within tolerance
+# are accepted greedily, closest first, and each track and peak is used at most
+# once, so one step costs O(P log P). Unmatched peaks start new tracks, and a
+# track that has not been matched for more than max_gap steps is closed.
+
+TRACK_COLUMNS = ["track", "step", "label", "frequency", "amplitude"]
+
+
+class PeakTracker:
+    def __init__(self, tolerance, max_gap=0):
+        self.tolerance = tolerance  # Largest frequency change between linked peaks, in Hz
+        self.max_gap = max_gap  # Steps a track may miss before it is closed
+        self.step = 0
+        self.n_tracks = 0
+        self._active_ids = np.empty(0, dtype=np.intp)
+        self._active_freq = np.empty(0)
+        self._last_step = np.empty(0, dtype=np.intp)
+        self._history = {column: [] for column in TRACK_COLUMNS}
+
+    def _match(self, frequencies):  # (peak, active track) index pairs, one-to-one, closest first
+        if len(self._active_freq) == 0 or len(frequencies) == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        order = np.argsort(self._active_freq)
+        sorted_freq = self._active_freq[order]
+        right = np.searchsorted(sorted_freq, frequencies)
+        left = right - 1
+
+        peaks = np.concatenate((np.arange(len(frequencies)),) * 2)
+        neighbours = np.concatenate((left, right))
+        valid = (neighbours >= 0) & (neighbours < len(sorted_freq))
+        peaks, neighbours = peaks[valid], neighbours[valid]
+        distance = np.abs(sorted_freq[neighbours] - frequencies[peaks])
+        close = distance <= self.tolerance
+        peaks, tracks, distance = peaks[close], order[neighbours[close]], distance[close]
+
+        matched_peaks, matched_tracks = [], []
+        used_peaks, used_tracks = set(), set()
+        for i in np.argsort(distance, kind="stable"):
+            peak, track = peaks[i], tracks[i]
+            if peak in used_peaks or track in used_tracks:
+                continue
+            used_peaks.add(peak)
+            used_tracks.add(track)
+            matched_peaks.append(peak)
+            matched_tracks.append(track)
+        return np.array(matched_peaks, dtype=np.intp), np.array(matched_tracks, dtype=np.intp)
+
+    def update(self, frequencies, amplitudes=None, label=None):  # Link one step of peaks; returns their track ids
+        frequencies = np.asarray(frequencies, dtype=float)
+        amplitudes = np.full(len(frequencies), np.nan) if amplitudes is None else np.asarray(amplitudes, dtype=float)
+        step = self.step
+        label = step if label is None else label
+
+        matched_peaks, matched_tracks = self._match(frequencies)
+        ids = np.empty(len(frequencies), dtype=np.intp)
+        ids[matched_peaks] = self._active_ids[matched_tracks]
+        self._active_freq[matched_tracks] = frequencies[matched_peaks]
+        self._last_step[matched_tracks] = step
+
+        new = np.ones(len(frequencies), dtype=bool)
+        new[matched_peaks] = False
+        new_ids = self.n_tracks + np.arange(np.count_nonzero(new))
+        self.n_tracks += len(new_ids)
+        ids[new] = new_ids
+        self._active_ids = np.concatenate((self._active_ids, new_ids))
+        self._active_freq = np.concatenate((self._active_freq, frequencies[new]))
+        self._last_step = np.concatenate((self._last_step, np.full(len(new_ids), step)))
+
+        alive = step - self._last_step <= self.max_gap  # Close tracks that missed too many steps
+        self._active_ids = self._active_ids[alive]
+        self._active_freq = self._active_freq[alive]
+        self._last_step = self._last_step[alive]
+
+        self._history["track"].extend(ids)
+        self._history["step"].extend([step] * len(ids))
+        self._history["label"].extend([label] * len(ids))
+        self._history["frequency"].extend(frequencies)
+        self._history["amplitude"].extend(amplitudes)
+        self.step += 1
+        return ids
+
+    def active_tracks(self):  # Track ids still open for linking
+        return self._active_ids.copy()
+
+    def history(self):  # One row per linked peak, ordered by track then step
+        import pandas as pd
+        table = pd.DataFrame(self._history, columns=TRACK_COLUMNS)
+        return table.sort_values(["track", "step"], kind="stable").reset_index(drop=True)
+
+    def summary(self):  # One row per track: extent, drift and mean amplitude
+        grouped = self.history().groupby("track")
+        table = grouped.agg(
+            first_step=("step", "min"), last_step=("step", "max"), n_peaks=("step", "size"),
+            start_frequency=("frequency", "first"), end_frequency=("frequency", "last"),
+            mean_frequency=("frequency", "mean"), mean_amplitude=("amplitude", "mean"),
+        )
+        table["drift"] = table["end_frequency"] - table["start_frequency"]
+        return table.reset_index()
+
+    def to_csv(self, path, summary=False):  # Export the track histories (or the per-track summary)
+        (self.summary() if summary else self.history()).to_csv(path, index=False)
+
+
+def track_spectrogram(times, freq, asd, tolerance, min_amplitude=None, prominence=None,
+                      max_gap=0, tracker=None):  # Track peaks frame by frame through a spectrogram
+    from scipy.signal import find_peaks
+    tracker = tracker or PeakTracker(tolerance, max_gap=max_gap)
+    for t, frame in zip(times, asd):
+        frame = np.asarray(frame)
+        peaks, _ = find_peaks(frame, height=min_amplitude, prominence=prominence)
+        tracker.update(freq[peaks], frame[peaks], label=t)
+    return tracker
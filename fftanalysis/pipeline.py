@@ -0,0 +1,211 @@
+import os
+import time
+import queue
+import argparse
+import threading
+from fftanalysis.analyzer import FFTAnalyzer, CHANNELS
+from fftanalysis.batch_analysis import find_recordings, channel_peaks, peak_rows, peak_table, write_peak_table
+
+# Pipelined analysis of a series of recordings.
+#
+# Three stages run concurrently and hand work over through bounded queues:
+#
+#   readers (threads) -> parse the next files          -> loaded queue
+#   compute           -> FFT and peak detection         -> computed queue
+#   writer            -> render plots and collect rows
+#
+# A full queue blocks the stage feeding it (backpressure), so at most
+# queue_size parsed recordings wait between stages and memory stays bounded no
+# matter how many files there are. Parsing and the FFTs spend most of their time
+# in pandas/numpy code that releases the GIL, so threads overlap I/O with
+# compute. Every stage records how long its workers were busy, starved (waiting
+# for input) and blocked (waiting for room downstream); the report shows which
+# stage is the bottleneck.
+
+_DONE = object()  # End-of-stream marker passed down the queues
+
+
+class StageStats:
+    def __init__(self, name, workers):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.errors = 0
+        self.busy = 0.0
+        self.starved = 0.0
+        self.blocked = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, busy=0.0, starved=0.0, blocked=0.0, items=0, errors=0):
+        with self._lock:
+            self.busy += busy
+            self.starved += starved
+            self.blocked += blocked
+            self.items += items
+            self.errors += errors
+
+    def report(self, wall):  # Fractions of the available worker time
+        total = max(wall * self.workers, 1e-12)
+        return {
+            "stage": self.name,
+            "workers": self.workers,
+            "items": self.items,
+            "errors": self.errors,
+            "busy": self.busy / total,
+            "starved": self.starved / total,
+            "blocked": self.blocked / total,
+        }
+
+
+class Pipeline:
+    def __init__(self, read, compute, write, readers=2, computers=1, queue_size=2):
+        self.stages = [  # (function, stats) in pipeline order; the writer is always a single thread
+            (read, StageStats("read", readers)),
+            (compute, StageStats("compute", computers)),
+            (write, StageStats("write", 1)),
+        ]
+        self.queue_size = queue_size
+        self.wall = 0.0
+
+    def _worker(self, function, stats, inbox, outbox, remaining, n_next):
+        while True:
+            start = time.perf_counter()
+            task = inbox.get()
+            waited = time.perf_counter() - start
+            if task is _DONE:
+                stats.add(starved=waited)
+                with remaining["lock"]:
+                    remaining["count"] -= 1
+                    last = remaining["count"] == 0
+                if last and outbox is not None:  # The last worker of a stage closes the next one
+                    for _ in range(n_next):
+                        outbox.put(_DONE)
+                return
+
+            index, label, payload = task
+            start = time.perf_counter()
+            try:
+                result = function(payload)
+            except Exception as e:  # The item is dropped; the other items carry on
+                stats.add(busy=time.perf_counter() - start, starved=waited, errors=1)
+                print(f"Error in {stats.name} stage for {label}: {e!r}")
+                continue
+            busy = time.perf_counter() - start
+
+            start = time.perf_counter()
+            if outbox is not None:
+                outbox.put((index, label, result))  # Blocks while the next stage is behind
+            else:
+                self.results[index] = result
+            stats.add(busy=busy, starved=waited, blocked=time.perf_counter() - start, items=1)
+
+    def run(self, items):  # Results of the write stage in input order; failed items are left out
+        self.results = {}
+        inbox = queue.Queue()
+        for index, item in enumerate(items):
+            inbox.put((index, item, item))
+        for _ in range(self.stages[0][1].workers):
+            inbox.put(_DONE)
+
+        queues = [inbox] + [queue.Queue(maxsize=self.queue_size) for _ in self.stages[1:]] + [None]
+        threads = []
+        for i, (function, stats) in enumerate(self.stages):
+            n_next = self.stages[i + 1][1].workers if i + 1 < len(self.stages) else 0
+            remaining = {"count": stats.workers, "lock": threading.Lock()}
+            for _ in range(stats.workers):
+                threads.append(threading.Thread(
+                    target=self._worker, args=(function, stats, queues[i], queues[i + 1], remaining, n_next),
+                    name=f"pipeline-{stats.name}", daemon=True,
+                ))
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.wall = time.perf_counter() - start
+        return [self.results[index] for index in sorted(self.results)]
+
+    def utilization(self):  # Per-stage busy/starved/blocked fractions of the last run
+        return [stats.report(self.wall) for _, stats in self.stages]
+
+    def print_report(self):
+        print(f"Pipeline wall time: {self.wall:.2f} s")
+        print(f"{'stage':<8} {'workers':>7} {'items':>6} {'errors':>6} {'busy':>7} {'starved':>8} {'blocked':>8}")
+        rows = self.utilization()
+        for row in rows:
+            print(f"{row['stage']:<8} {row['workers']:>7} {row['items']:>6} {row['errors']:>6} "
+                  f"{row['busy']:>7.1%} {row['starved']:>8.1%} {row['blocked']:>8.1%}")
+        bottleneck = max(rows, key=lambda row: row["busy"])
+        print(f"Bottleneck: {bottleneck['stage']} stage")
+
+
+def run_pipeline(source, output=None, plot_dir=None, readers=2, queue_size=2, fft_workers=-1,
+                 channels=None, use_cache=True, **options):  # Overlapped load -> FFT/peaks -> plots for every recording
+    files = find_recordings(source)
+    channels = list(channels or CHANNELS)
+    if plot_dir:
+        import matplotlib.pyplot as plt
+        plt.switch_backend("Agg")  # Plots are rendered by the writer thread and only saved; GUI backends need the main thread
+        os.makedirs(plot_dir, exist_ok=True)
+
+    def read(file_path):
+        analyzer = FFTAnalyzer(file_path)
+        analyzer.load_data(use_cache=use_cache)
+        return analyzer
+
+    def compute(analyzer):  # Peak results per channel; the single compute thread lets the FFT use every core
+        return analyzer, list(channel_peaks(analyzer, channels, workers=fft_workers, **options))
+
+    def write(computed):
+        analyzer, results = computed
+        rows = []
+        for channel, freq, asd, peaks, prominences in results:
+            rows.extend(peak_rows(analyzer.file_name, channel, freq, asd, peaks, prominences))
+            if plot_dir:  # Point the analyzer at this channel's spectrum and render it decimated
+                analyzer.positive_freq, analyzer.positive_asd = freq, asd
+                stem = os.path.splitext(analyzer.file_name)[0]
+                analyzer.plot_asd(os.path.join(plot_dir, f"{stem}_{channel}.png"),
+                                  peaks=(freq[peaks], asd[peaks]), decimate=2000, show=False)
+        return rows
+
+    pipeline = Pipeline(read, compute, write, readers=readers, queue_size=queue_size)
+    results = pipeline.run(files)
+    table = peak_table([row for rows in results for row in rows])
+    print(f"Analyzed {len(results)} of {len(files)} files, found {len(table)} peaks.")
+    pipeline.print_report()
+    if output:
+        write_peak_table(table, output)
+        print(f"Peak table written to {output}")
+    return table, pipeline.utilization()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipelined FFT peak analysis of LVM recordings.")
+    parser.add_argument("source", help="Directory of .lvm files or a glob pattern")
+    parser.add_argument("-o", "--output", default="peaks.csv", help="Output table (.csv or .parquet)")
+    parser.add_argument("--plots", default=None, help="Directory for per-channel ASD plots")
+    parser.add_argument("--readers", type=int, default=2, help="Number of file reader threads")
+    parser.add_argument("--queue-size", type=int, default=2, help="Recordings buffered between stages")
+    parser.add_argument("--channels", nargs="+", default=None, choices=CHANNELS)
+    parser.add_argument("--mode", choices=["fft", "welch", "nufft", "auto"], default="fft")
+    parser.add_argument("--nperseg", type=int, default=4096, help="Welch segment length")
+    parser.add_argument("--overlap", type=float, default=0.5, help="Welch segment overlap fraction")
+    parser.add_argument("--min-amplitude", type=float, default=0.05)
+    parser.add_argument("--prominence", type=float, default=0.01)
+    parser.add_argument("--width", type=float, default=None)
+    parser.add_argument("--min-snr", type=float, default=None, help="Threshold over the local noise floor "
+                        "instead of --min-amplitude")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-parse the text files")
+    args = parser.parse_args()
+
+    run_pipeline(
+        args.source, output=args.output, plot_dir=args.plots, readers=args.readers,
+        queue_size=args.queue_size, channels=args.channels, use_cache=not args.no_cache,
+        mode=args.mode, nperseg=args.nperseg, overlap=args.overlap,
+        min_amplitude=args.min_amplitude, prominence=args.prominence, width=args.width, min_snr=args.min_snr,
+    )
+
+
+if __name__ == "__main__":
+    main()
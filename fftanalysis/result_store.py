@@ -0,0 +1,119 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+import numpy as np
+from fftanalysis.lvm_cache import file_digest
+
+# Persistent store for computed spectra and peak tables.
+#
+# Results are saved as compressed .npz files keyed by the input file's content
+# hash, the channel and the FFT/peak parameters (spectrum_key builds the key of
+# a spectrum for every tool that shares the store, sample interval included), so re-tuning thresholds or
+# regenerating reports never recomputes a spectrum. Content hashes are
+# remembered per path together with size and mtime, so an unchanged file is
+# only hashed once. When the store grows past max_bytes the least recently used
+# results are evicted.
+
+
+def default_store_dir():  # Store location, overridable with FFT_RESULT_STORE
+    return os.environ.get(
+        "FFT_RESULT_STORE", os.path.join(os.path.expanduser("~"), ".cache", "fft_results")
+    )
+
+
+class ResultStore:
+    def __init__(self, store_dir=None, max_bytes=2 * 2**30):
+        self.store_dir = store_dir or default_store_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.store_dir, exist_ok=True)
+
+    def content_hash(self, file_path):  # Digest of the file, re-hashed only when size or mtime change
+        index_path = os.path.join(self.store_dir, "digests.json")
+        stat = os.stat(file_path)
+        key = os.path.abspath(file_path)
+        with self._lock:
+            try:
+                with open(index_path) as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                index = {}
+            entry = index.get(key)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                return entry["digest"]
+            digest = file_digest(file_path)
+            index[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest}
+            self._write_atomic(index_path, lambda f: f.write(json.dumps(index).encode()))
+            return digest
+
+    def spectrum_key(self, file_path, channel, dt, mode="fft", dtype="float64", **params):  # (digest, channel, params) of a spectrum
+        params = dict(params, mode=mode, dtype=np.dtype(dtype).name, dt=float(dt))
+        return self.content_hash(file_path), channel, params
+
+    def _path(self, kind, digest, channel, params):
+        key = json.dumps([kind, digest, channel, params], sort_keys=True, default=str)
+        return os.path.join(self.store_dir, f"{kind}-{hashlib.sha256(key.encode()).hexdigest()[:32]}.npz")
+
+    def _write_atomic(self, path, write):  # Readers never see a partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _load(self, path):
+        try:
+            with np.load(path) as stored:
+                arrays = {name: stored[name] for name in stored.files}
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        os.utime(path)  # Mark as recently used for eviction
+        self.hits += 1
+        return arrays
+
+    def _save(self, path, **arrays):
+        self._write_atomic(path, lambda f: np.savez_compressed(f, **arrays))
+        self._evict()
+
+    def _evict(self):  # Drop least recently used results until the store fits max_bytes
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.store_dir):
+                if name.endswith(".npz"):
+                    stat = os.stat(os.path.join(self.store_dir, name))
+                    entries.append((stat.st_mtime, stat.st_size, name))
+            total = sum(size for _, size, _ in entries)
+            for _, size, name in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(os.path.join(self.store_dir, name))
+                except OSError:
+                    pass
+                total -= size
+
+    def get_spectrum(self, digest, channel, params):  # (positive_freq, positive_asd) or None
+        arrays = self._load(self._path("spectrum", digest, channel, params))
+        return None if arrays is None else (arrays["freq"], arrays["asd"])
+
+    def put_spectrum(self, digest, channel, params, freq, asd):
+        self._save(self._path("spectrum", digest, channel, params), freq=np.asarray(freq), asd=np.asarray(asd))
+
+    def get_peaks(self, digest, channel, params):  # Dict of peak arrays or None
+        return self._load(self._path("peaks", digest, channel, params))
+
+    def put_peaks(self, digest, channel, params, **peak_arrays):
+        self._save(self._path("peaks", digest, channel, params), **peak_arrays)
+
+    def stats(self):
+        size = sum(os.path.getsize(os.path.join(self.store_dir, name))
+                   for name in os.listdir(self.store_dir) if name.endswith(".npz"))
+        return {"hits": self.hits, "misses": self.misses, "bytes": size, "max_bytes": self.max_bytes}
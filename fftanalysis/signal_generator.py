@@ -0,0 +1,92 @@
+import numpy as np
+from numpy.lib.format import open_memmap
+
+# Reproducible synthetic interferometer signals.
+#
+# A SignalGenerator holds a set of tones (amplitude, frequency, phase), a noise
+# model and a random-walk drift, for one or more channels. Every chunk is
+# computed in one shot: the tones are combined with a matrix product over a
+# (tones x samples) phase grid, and channels differ by a phase offset applied
+# as an outer product, so no per-tone temporaries are summed. Noise and drift
+# carry their state between chunks. For a given seed the output does not depend
+# on the chunk size, so multi-GB fixtures can be streamed straight to .lvm or
+# .npy files.
+
+# Three-pole approximation of a 1/f (pink) spectrum, J. O. Smith's filter
+PINK_B = [0.049922035, -0.095993537, 0.050612699, -0.004408786]
+PINK_A = [1, -2.494956002, 2.017265875, -0.522189400]
+NOISE_MODELS = ("white", "pink")
+TIME_FORMAT = "%.12g"  # Time column of write_lvm
+
+
+class SignalGenerator:
+    def __init__(self, sampling_rate, tones=(), noise_amplitude=0.0, noise="white",
+                 drift_amplitude=0.0, n_channels=1, channel_phases=None, seed=None):
+        if noise not in NOISE_MODELS:
+            raise ValueError(f"Unknown noise model: {noise!r}")
+        tones = np.asarray(tones, dtype=float).reshape(-1, 3)  # Rows of (amplitude, frequency, phase)
+        self.sampling_rate = sampling_rate
+        self.amplitudes, self.frequencies, self.phases = tones.T
+        self.noise_amplitude = noise_amplitude
+        self.noise = noise
+        self.drift_amplitude = drift_amplitude  # Random-walk step size per sqrt(second)
+        self.n_channels = n_channels
+        self.channel_phases = np.zeros(n_channels) if channel_phases is None else np.asarray(channel_phases, float)
+        self.seed = seed
+
+    def _tones(self, t):  # Sum of all tones for every channel, shape (channels, samples)
+        phase = 2 * np.pi * np.outer(self.frequencies, t) + self.phases[:, None]
+        sine = self.amplitudes @ np.sin(phase)
+        cosine = self.amplitudes @ np.cos(phase)
+        # sin(x + c) = sin(x) cos(c) + cos(x) sin(c), one outer product per term
+        return np.outer(np.cos(self.channel_phases), sine) + np.outer(np.sin(self.channel_phases), cosine)
+
+    def chunks(self, n_samples, chunk_size=1_000_000):  # Yields (time, signals[channels, samples]) blocks
+        rng = np.random.default_rng(self.seed)
+        pink_state = np.zeros((self.n_channels, len(PINK_A) - 1))
+        drift = np.zeros(self.n_channels)
+        dt = 1 / self.sampling_rate
+        n_draws = self.n_channels * (bool(self.noise_amplitude) + bool(self.drift_amplitude))
+
+        for start in range(0, n_samples, chunk_size):
+            n = min(chunk_size, n_samples - start)
+            t = (start + np.arange(n)) * dt
+            signals = self._tones(t)
+
+            # One sample-major draw per chunk keeps the random stream independent of chunk boundaries
+            draws = rng.standard_normal((n, n_draws)).T
+            if self.noise_amplitude:
+                noise = draws[:self.n_channels]
+                if self.noise == "pink":
+                    from scipy.signal import lfilter
+                    noise, pink_state = lfilter(PINK_B, PINK_A, noise, axis=1, zi=pink_state)
+                signals += self.noise_amplitude * noise
+            if self.drift_amplitude:
+                steps = draws[-self.n_channels:] * (self.drift_amplitude * np.sqrt(dt))
+                walk = drift[:, None] + np.cumsum(steps, axis=1)
+                drift = walk[:, -1]
+                signals += walk
+            yield t, signals
+
+    def generate(self, n_samples):  # Whole signal at once; 1-D when there is a single channel
+        t, signals = next(self.chunks(n_samples, chunk_size=max(n_samples, 1)))
+        return t, signals[0] if self.n_channels == 1 else signals
+
+    def write_lvm(self, path, n_samples, chunk_size=1_000_000, fmt="%.6f"):  # Tab-separated text load_data can read
+        # fmt applies to the signal columns; time keeps 12 significant digits, so
+        # rates that do not divide 1e6 (48 kHz, 2048 Hz) still give the right step
+        formats = [TIME_FORMAT] + [fmt] * self.n_channels
+        with open(path, "w") as f:
+            f.write(f"; synthetic recording, {self.n_channels} channels at {self.sampling_rate} Hz, "
+                    f"seed {self.seed}\n")
+            for t, signals in self.chunks(n_samples, chunk_size):
+                np.savetxt(f, np.column_stack((t, signals.T)), fmt=formats, delimiter="\t")
+
+    def write_npy(self, path, n_samples, chunk_size=1_000_000):  # Columnar binary: row 0 is time, then channels
+        out = open_memmap(path, mode="w+", dtype=np.float64, shape=(self.n_channels + 1, n_samples))
+        start = 0
+        for t, signals in self.chunks(n_samples, chunk_size):
+            out[0, start:start + len(t)] = t
+            out[1:, start:start + len(t)] = signals
+            start += len(t)
+        out.flush()
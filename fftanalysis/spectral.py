@@ -0,0 +1,52 @@
+import numpy as np
+from scipy.fft import rfft
+from fftanalysis.fft_cache import get_fft_setup
+
+# Numerical kernels shared by FFTAnalyzer and the batch tools.
+# Normalisation follows FFTAnalyzer.perform_fft: PSD = |X|^2 / sum(w^2), which
+# reduces to the original |X|^2 / N for a rectangular window.
+# float32 input stays in single precision (complex64 spectra) throughout.
+
+
+def segment_starts(n_samples, nperseg, noverlap):  # Start index of every full segment
+    step = nperseg - noverlap
+    if nperseg > n_samples:
+        raise ValueError(f"Segment length {nperseg} exceeds signal length {n_samples}.")
+    if step <= 0:
+        raise ValueError("Overlap must be smaller than the segment length.")
+    return np.arange(0, n_samples - nperseg + 1, step)
+
+
+def welch_psd(signal, dt, nperseg=4096, overlap=0.5, window="hann"):  # Segment-averaged one-sided PSD
+    noverlap = int(nperseg * overlap)
+    starts = segment_starts(len(signal), nperseg, noverlap)
+    dtype = np.float32 if signal.dtype == np.float32 else np.float64
+    setup = get_fft_setup(nperseg, dt, window=window, dtype=dtype)
+    win = setup.window
+    scale = 1.0 / (np.sum(win**2, dtype=np.float64) * len(starts))
+
+    psd = np.zeros(nperseg // 2 + 1, dtype=dtype)
+    segment = np.empty(nperseg, dtype=dtype)
+    for start in starts:  # Only one segment is ever resident, even for memory-mapped input
+        np.multiply(signal[start:start + nperseg], win, out=segment)
+        spectrum = rfft(segment)
+        psd += spectrum.real**2 + spectrum.imag**2
+    psd *= scale
+    return setup.rfreq, psd[:nperseg // 2]  # Match the [:N//2] convention of perform_fft
+
+
+def batched_asd(signals, dt, workers=None):  # One-sided ASD of every row of a (channels x samples) array
+    N = signals.shape[-1]
+    spectrum = rfft(signals, axis=-1, workers=workers)[..., :N // 2]  # Real input: only the positive half is computed
+    asd = np.abs(spectrum)
+    asd *= 1.0 / np.sqrt(N)  # sqrt(|X|^2 / N), as in perform_fft
+    return get_fft_setup(N, dt).rfreq, asd
+
+
+def zoom_asd(signal, dt, f_start, f_stop, n_points=1024):  # ASD on n_points frequencies in [f_start, f_stop]
+    from scipy.signal import ZoomFFT
+    N = len(signal)
+    transform = ZoomFFT(N, [f_start, f_stop], m=n_points, fs=1 / dt, endpoint=True)  # Chirp-z over the band only
+    spectrum = transform(signal)
+    freq = np.linspace(f_start, f_stop, n_points)
+    return freq, np.abs(spectrum) / np.sqrt(N), spectrum
@@ -0,0 +1,83 @@
+import numpy as np
+from numpy.lib.format import open_memmap
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import rfft
+from fftanalysis.fft_cache import get_fft_setup
+
+# Short-time Fourier transform for long captures.
+# Frames are transformed in blocks of block_frames rows at a time and written
+# straight into the output (a .npy memmap when out_path is given), so only one
+# block of frames is ever held in memory.
+
+
+def compute_spectrogram(signal, dt, nperseg=4096, hop=None, window="hann", out_path=None,
+                        block_frames=256, workers=None):  # Returns (times, freq, asd[frames, bins])
+    hop = hop or nperseg // 2
+    N = len(signal)
+    if nperseg > N:
+        raise ValueError(f"Window length {nperseg} exceeds signal length {N}.")
+    n_frames = 1 + (N - nperseg) // hop
+    n_bins = nperseg // 2
+    setup = get_fft_setup(nperseg, dt, window=window)
+    win = setup.window
+    scale = 1.0 / np.sqrt(np.sum(win**2))  # Same normalisation as the Welch ASD
+
+    if out_path:
+        asd = open_memmap(out_path, mode="w+", dtype=np.float64, shape=(n_frames, n_bins))
+    else:
+        asd = np.empty((n_frames, n_bins))
+
+    for first in range(0, n_frames, block_frames):
+        last = min(first + block_frames, n_frames)
+        chunk = signal[first * hop:(last - 1) * hop + nperseg]  # Only the samples this block needs
+        frames = sliding_window_view(chunk, nperseg)[::hop] * win  # Strided view, one windowed copy
+        spectrum = rfft(frames, axis=-1, workers=workers)[:, :n_bins]
+        block = np.abs(spectrum)
+        block *= scale
+        asd[first:last] = block
+
+    if out_path:
+        asd.flush()
+    times = (np.arange(n_frames) * hop + nperseg / 2) * dt  # Frame centres
+    return times, setup.rfreq, asd
+
+
+def _block_max(a, axis, target, block_rows=256):  # Max-pool along one axis down to at most target bins
+    n = a.shape[axis]
+    if n <= target:
+        return np.asarray(a), np.arange(n)
+    edges = np.linspace(0, n, target + 1).astype(np.intp)[:-1]
+    if axis == 1:
+        return np.maximum.reduceat(np.asarray(a), edges, axis=1), edges
+    rows = []
+    for lo, hi in zip(edges, np.append(edges[1:], n)):  # Reads a memmap one time block at a time
+        rows.append(np.max(np.asarray(a[lo:hi]), axis=0))
+    return np.array(rows), edges
+
+
+def decimate_spectrogram(times, freq, asd, max_time_bins=1000, max_freq_bins=1000):  # Peak-preserving reduction
+    reduced, t_idx = _block_max(asd, 0, max_time_bins)
+    reduced, f_idx = _block_max(reduced, 1, max_freq_bins)
+    return times[t_idx], freq[f_idx], reduced
+
+
+def plot_spectrogram(times, freq, asd, title="Spectrogram", save_path=None,
+                     max_time_bins=1000, max_freq_bins=1000, show=True):  # Render a decimated time-frequency image
+    import matplotlib.pyplot as plt
+    times, freq, image = decimate_spectrogram(times, freq, asd, max_time_bins, max_freq_bins)
+    image = np.log10(np.maximum(image, np.finfo(float).tiny))
+
+    plt.figure(figsize=(10, 6))
+    plt.imshow(image.T, origin="lower", aspect="auto", cmap="viridis",
+               extent=[times[0], times[-1], freq[0], freq[-1]], interpolation="nearest")
+    plt.colorbar(label='log10 ASD (m/√Hz)')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Frequency (Hz)')
+    plt.title(title)
+
+    if save_path:  # Save the plot if a path is provided
+        plt.savefig(save_path)
+    if show:
+        plt.show()
+    else:
+        plt.close()
@@ -0,0 +1,119 @@
+import numpy as np
+from scipy.fft import rfft, rfftfreq
+from fftanalysis.signal_generator import SignalGenerator
+
+# Live monitoring of known fringe frequencies.
+#
+# Samples arrive in blocks and are kept in a fixed-size ring buffer holding the
+# last window_size samples. Each tracked tone keeps a sliding DFT over that
+# window, referenced to absolute sample time:
+#
+#     X(n) = X(n-1) + x[n] e^{-jwn} - x[n-M] e^{-jw(n-M)}
+#
+# which costs O(1) per sample per tone and works for any frequency, not only
+# bin centres. Rounding error is cleared by an exact recomputation from the
+# buffer whenever a full ASD snapshot is emitted.
+
+
+class RingBuffer:
+    def __init__(self, size):
+        self.size = size
+        self.buffer = np.zeros(size)
+        self.write = 0  # Next slot to overwrite
+        self.count = 0  # Total samples pushed
+
+    def push(self, block):  # Store a block of at most size samples and return the samples it displaced
+        n = len(block)
+        idx = (self.write + np.arange(n)) % self.size
+        evicted = self.buffer[idx]  # Zeros until the buffer has filled once
+        self.buffer[idx] = block
+        self.write = (self.write + n) % self.size
+        self.count += n
+        return evicted
+
+    def ordered(self):  # Buffer contents, oldest sample first
+        return np.concatenate((self.buffer[self.write:], self.buffer[:self.write]))
+
+
+class StreamingAnalyzer:
+    def __init__(self, sample_rate, frequencies, window_size=4096, snapshot_interval=None,
+                 on_snapshot=None):
+        self.sample_rate = sample_rate
+        self.frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+        self.window_size = window_size
+        self.snapshot_interval = snapshot_interval or window_size
+        self.on_snapshot = on_snapshot  # Called with each snapshot dict
+        self.ring = RingBuffer(window_size)
+        self.snapshot = None
+
+        self._cycles = self.frequencies / sample_rate  # Cycles per sample for each tone
+        self._state = np.zeros(len(self.frequencies), dtype=complex)
+        self._eviction_phase = np.exp(2j * np.pi * np.mod(self._cycles * window_size, 1.0))
+        self._next_snapshot = self.snapshot_interval
+
+    def _phasors(self, start, n):  # e^{-jwk} for absolute sample indices start..start+n-1, shape (tones, n)
+        k = start + np.arange(n)
+        return np.exp(-2j * np.pi * np.mod(np.outer(self._cycles, k), 1.0))
+
+    def ingest(self, block):  # Add a block of samples; emits a snapshot when the interval is crossed
+        block = np.asarray(block, dtype=float)
+        for start in range(0, len(block), self.window_size):
+            piece = block[start:start + self.window_size]
+            phasors = self._phasors(self.ring.count, len(piece))
+            evicted = self.ring.push(piece)
+            self._state += phasors @ piece - self._eviction_phase * (phasors @ evicted)
+
+        if self.ring.count >= self._next_snapshot:
+            self._emit_snapshot()
+            while self._next_snapshot <= self.ring.count:
+                self._next_snapshot += self.snapshot_interval
+
+    def resync(self):  # Exact recomputation of the tone states from the buffer contents
+        start = self.ring.count - self.window_size
+        self._state = self._phasors(start, self.window_size) @ self.ring.ordered()
+
+    def tones(self):  # Current amplitude and phase of every tracked frequency
+        filled = min(self.ring.count, self.window_size)
+        amplitudes = 2 * np.abs(self._state) / max(filled, 1)
+        return self.frequencies, amplitudes, np.angle(self._state)
+
+    def _emit_snapshot(self):  # Full ASD of the current window
+        self.resync()
+        window = self.ring.ordered()
+        M = self.window_size
+        freq = rfftfreq(M, 1 / self.sample_rate)[:M // 2]
+        asd = np.abs(rfft(window)[:M // 2]) / np.sqrt(M)
+        _, amplitudes, phases = self.tones()
+        self.snapshot = {
+            "sample": self.ring.count,
+            "time": self.ring.count / self.sample_rate,
+            "freq": freq,
+            "asd": asd,
+            "tone_amplitudes": amplitudes,
+            "tone_phases": phases,
+        }
+        if self.on_snapshot:
+            self.on_snapshot(self.snapshot)
+
+
+def main():  # Stream the simulated Michelson interferometer signal from MI_example.py
+    sampling_rate = 1000  # Samples per second
+    interferometer_freq = 10  # Fringe frequency in Hz
+    noise_amplitude = 0.5  # Amplitude of the Gaussian noise
+    block_size = 100  # Samples per incoming block
+
+    def report(snapshot):
+        peak = snapshot["freq"][np.argmax(snapshot["asd"])]
+        print(f"t = {snapshot['time']:.1f} s: tone amplitude = {snapshot['tone_amplitudes'][0]:.3f}, "
+              f"phase = {snapshot['tone_phases'][0]:.3f} rad, ASD peak at {peak:.2f} Hz")
+
+    analyzer = StreamingAnalyzer(sampling_rate, [interferometer_freq], window_size=2000,
+                                 snapshot_interval=1000, on_snapshot=report)
+    generator = SignalGenerator(sampling_rate, tones=[(1, interferometer_freq, np.pi / 2)],
+                                noise_amplitude=noise_amplitude, seed=0)
+    for _, block in generator.chunks(10 * sampling_rate, chunk_size=block_size):
+        analyzer.ingest(block[0])
+
+
+if __name__ == "__main__":
+    main()
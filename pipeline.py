@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+
+from fftanalysis.pipeline import *  # noqa: F401,F403 - keeps "from pipeline import ..." working
+from fftanalysis.pipeline import main
+
+# Pipelined peak analysis: python pipeline.py <directory or glob> [--plots DIR].
+# The code is in fftanalysis.pipeline; this wrapper only keeps the script name.
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+
+from fftanalysis.streaming import *  # noqa: F401,F403 - keeps "from streaming import ..." working
+from fftanalysis.streaming import main
+
+# Live ASD of the simulated interferometer signal: python streaming.py.
+# The code is in fftanalysis.streaming; this wrapper only keeps the script name.
+
+if __name__ == "__main__":
+    main()
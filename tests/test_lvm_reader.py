@@ -0,0 +1,65 @@
+import os
+import numpy as np
+import pytest
+from fftanalysis.lvm_reader import read_lvm, read_lvm_header, sample_interval, select_columns
+
+# Every fixture holds the same two channels in a different LabVIEW layout.
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+TIME = [0.0, 0.001, 0.002, 0.003, 0.004]
+X_A = [1.5, -2.25, 3.0, 0.125, -0.5]
+Y_A = [10.0, 20.0, 30.0, 40.0, 50.0]
+NAMES = ["Time(s)", "polarized_x_a", "polarized_y_a"]
+
+
+@pytest.mark.parametrize("name", ["tab.lvm", "comma.lvm", "decimal_comma.lvm", "segments.lvm", "plain.lvm"])
+def test_layouts_read_the_same_columns(name):
+    data = read_lvm(os.path.join(DATA, name), names=NAMES)
+    assert list(data) == NAMES
+    np.testing.assert_array_equal(data["Time(s)"], TIME)
+    np.testing.assert_array_equal(data["polarized_x_a"], X_A)
+    np.testing.assert_array_equal(data["polarized_y_a"], Y_A)
+
+
+def test_header_fields_and_sample_interval():
+    data = read_lvm(os.path.join(DATA, "comma.lvm"))
+    assert data.header["Separator"] == ["Comma"]
+    assert list(data) == ["X_Value", "polarized_x_a", "polarized_y_a"]
+    assert data.sample_interval == 0.001
+    assert sample_interval(data, "X_Value") == 0.001
+
+
+def test_segments():
+    data = read_lvm(os.path.join(DATA, "segments.lvm"), names=NAMES)
+    assert [(segment["start"], segment["length"]) for segment in data.segments] == [(0, 3), (3, 2)]
+    _, segments = read_lvm_header(os.path.join(DATA, "segments.lvm"))
+    assert [segment["names"][:3] for segment in segments] == [["X_Value", "polarized_x_a", "polarized_y_a"]] * 2
+
+
+def test_time_synthesised_without_x_column():
+    data = read_lvm(os.path.join(DATA, "no_x.lvm"), names=NAMES)
+    np.testing.assert_allclose(data["Time(s)"], 0.5 + 0.25 * np.arange(5))
+    np.testing.assert_array_equal(data["polarized_x_a"], X_A)
+
+
+def test_headerless_interval_from_time_column():
+    data = read_lvm(os.path.join(DATA, "plain.lvm"), names=NAMES)
+    assert data.sample_interval is None
+    assert sample_interval(data, "Time(s)") == pytest.approx(0.001)
+
+
+def test_usecols_and_dtype():
+    data = read_lvm(os.path.join(DATA, "tab.lvm"), names=NAMES, usecols=["polarized_y_a"], dtype=np.float32)
+    assert list(data) == ["Time(s)", "polarized_y_a"]
+    assert data["Time(s)"].dtype == np.float64
+    assert data["polarized_y_a"].dtype == np.float32
+    with pytest.raises(ValueError):
+        read_lvm(os.path.join(DATA, "tab.lvm"), names=NAMES, usecols=["missing"])
+
+
+def test_select_columns_keeps_metadata():
+    data = select_columns(read_lvm(os.path.join(DATA, "tab.lvm"), names=NAMES), ["Time(s)", "polarized_x_a"])
+    assert list(data) == ["Time(s)", "polarized_x_a"]
+    assert data.sample_interval == 0.001
+    with pytest.raises(ValueError):
+        select_columns(data, ["polarized_y_b"])
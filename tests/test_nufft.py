@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from fftanalysis.nufft import nufft1, nufft_asd, sampling_irregularity
+
+
+@pytest.mark.parametrize("tolerance", [1e-6, 1e-9, 1e-12])
+def test_nufft1_matches_direct_sum(tolerance):
+    rng = np.random.default_rng(1)
+    theta = rng.uniform(0, 2 * np.pi, 500)
+    values = rng.standard_normal(500)
+    k = np.arange(64)
+    direct = np.exp(-1j * np.outer(k, theta)) @ values
+    error = np.max(np.abs(nufft1(theta, values, 64, tolerance) - direct)) / np.sum(np.abs(values))
+    assert error < 10 * tolerance
+
+
+def test_uniform_samples_give_the_fft_asd():
+    time = np.arange(1000) * 0.001
+    signal = np.random.default_rng(2).standard_normal(1000)
+    freq, asd = nufft_asd(time, signal, dt=0.001)
+    np.testing.assert_allclose(freq, np.fft.fftfreq(1000, 0.001)[:500])
+    np.testing.assert_allclose(asd, np.abs(np.fft.fft(signal))[:500] / np.sqrt(1000), atol=1e-7)
+
+
+@pytest.mark.parametrize("rate", [1000, 2048, 44100, 48000])
+def test_rounded_stamps_are_regular(rate):
+    check = sampling_irregularity(np.round(np.arange(200_000) / rate, 6))
+    assert not check["irregular"]
+    assert check["dt"] * rate == pytest.approx(1, rel=1e-6)
+
+
+def test_gaps_and_late_jitter_are_irregular():
+    time = np.round(np.arange(100_000) * 0.001, 6)
+    check = sampling_irregularity(np.delete(time, [500, 501, 70_000]))
+    assert check["irregular"] and check["gaps"] == 2 and check["missing"] == 3
+
+    jittered = time.copy()
+    jittered[1000:] += np.random.default_rng(3).uniform(-2e-4, 2e-4, len(time) - 1000)
+    assert sampling_irregularity(jittered)["irregular"]  # A clean head sets no coarse resolution
@@ -0,0 +1,28 @@
+import os
+import tempfile
+import numpy as np
+import pytest
+from fftanalysis.ooc_fft import out_of_core_asd, split_length
+
+
+@pytest.mark.parametrize("N", [4096, 3000, 1001, 97])  # Square, composite, odd and prime lengths
+def test_matches_numpy_fft(N):
+    signal = np.random.default_rng(N).standard_normal(N)
+    freq, asd = out_of_core_asd(signal, 0.001, memory_budget=48 * 64 * split_length(N)[1])  # Several blocks
+    assert len(asd) == len(freq) == N // 2
+    np.testing.assert_allclose(freq, np.fft.fftfreq(N, 0.001)[:N // 2])
+    np.testing.assert_allclose(asd, np.abs(np.fft.fft(signal))[:N // 2] / np.sqrt(N), rtol=1e-9, atol=1e-12)
+
+
+def test_private_scratch_is_removed(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    freq, asd = out_of_core_asd(np.sin(np.arange(1024)), 1.0)
+    assert os.listdir(tmp_path) == []
+    assert np.argmax(asd) == 163  # Still readable after the files are gone: 1 rad/sample is bin 1024 / 2pi
+
+
+def test_given_scratch_keeps_outputs(tmp_path):
+    signal = np.sin(np.arange(1024))
+    out_of_core_asd(signal, 1.0, scratch_dir=str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == ["asd.f64", "freq.f64"]
+    assert os.path.getsize(tmp_path / "asd.f64") < signal.nbytes  # Only the positive half is written